@@ -0,0 +1,31 @@
+import numpy as np
+
+try:
+    from fast_histogram import histogram1d
+except ImportError:
+    histogram1d = None
+
+def _value_range(values):
+    lo = float(values.min())
+    hi = float(values.max())
+    if hi <= lo:
+        lo -= 0.5
+        hi += 0.5
+    return lo, hi
+
+def uniform_histogram(values, bins):
+    values = np.asarray(values).ravel()
+    lo, hi = _value_range(values)
+
+    if histogram1d is not None:
+        counts = histogram1d(values, bins=bins, range=(lo, np.nextafter(hi, np.inf)))
+    else:
+        idx = ((values - lo) * (bins / (hi - lo))).astype(np.intp)
+        np.clip(idx, 0, bins - 1, out=idx)
+        counts = np.bincount(idx, minlength=bins)
+
+    return counts, np.linspace(lo, hi, bins + 1)
+
+def plot_histogram(ax, values, bins, **kwargs):
+    counts, edges = uniform_histogram(values, bins)
+    return ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **kwargs)
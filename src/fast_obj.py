@@ -0,0 +1,79 @@
+import re
+import numpy as np
+
+_FACE_REF_SUFFIX = re.compile(rb'/\S*')
+_VERTEX_PREFIXES = (b'v ', b'v\t')
+_FACE_PREFIXES = (b'f ', b'f\t')
+_IS_WHITESPACE = np.zeros(256, dtype=bool)
+_IS_WHITESPACE[list(b' \t\r\n\v\f')] = True
+
+def _row_token_counts(blob, n_rows):
+    data = np.frombuffer(blob, dtype=np.uint8)
+    is_sep = _IS_WHITESPACE[data]
+    starts = ~is_sep
+    starts[1:] &= is_sep[:-1]
+    row_ids = np.cumsum(data == ord('\n'))
+    return np.bincount(row_ids[starts], minlength=n_rows)
+
+def _parse_vertices(rows):
+    if not rows:
+        return np.zeros((0, 3), dtype=np.float64)
+
+    blob = b'\n'.join(rows)
+    counts = _row_token_counts(blob, len(rows))
+    values = np.fromstring(blob, dtype=np.float64, sep=' ')
+
+    if counts.min() >= 3 and values.size == counts.sum():
+        if counts.max() == counts.min():
+            return np.ascontiguousarray(values.reshape(-1, counts[0])[:, :3])
+        row_starts = np.cumsum(counts) - counts
+        return values[row_starts[:, None] + np.arange(3)]
+
+    return np.array([[float(t) for t in row.split()[:3]] for row in rows], dtype=np.float64)
+
+def _parse_faces(rows, vertex_counts):
+    if not rows:
+        return np.zeros((0, 3), dtype=np.int64)
+
+    stripped = _FACE_REF_SUFFIX.sub(b'', b'\n'.join(rows))
+    counts = _row_token_counts(stripped, len(rows))
+    values = np.fromstring(stripped, dtype=np.int64, sep=' ')
+
+    if counts.min() == counts.max() == 3 and values.size == 3 * len(rows):
+        faces = values.reshape(-1, 3)
+        bases = np.asarray(vertex_counts, dtype=np.int64)
+    else:
+        triangles = []
+        bases = []
+        for row, count in zip(stripped.split(b'\n'), vertex_counts):
+            idx = [int(t) for t in row.split()]
+            for k in range(1, len(idx) - 1):
+                triangles.append((idx[0], idx[k], idx[k + 1]))
+                bases.append(count)
+        faces = np.array(triangles, dtype=np.int64).reshape(-1, 3)
+        bases = np.array(bases, dtype=np.int64)
+
+    return np.where(faces < 0, faces + bases[:, None], faces - 1)
+
+def load_vertices_faces(path):
+    with open(path, 'rb') as f:
+        lines = f.read().splitlines()
+
+    vertex_rows = []
+    face_rows = []
+    face_vertex_counts = []
+
+    for line in lines:
+        if line.startswith(_VERTEX_PREFIXES):
+            vertex_rows.append(line[2:])
+        elif line.startswith(_FACE_PREFIXES):
+            face_rows.append(line[2:])
+            face_vertex_counts.append(len(vertex_rows))
+
+    vertices = _parse_vertices(vertex_rows)
+    faces = _parse_faces(face_rows, face_vertex_counts)
+
+    if faces.size and (faces.min() < 0 or faces.max() >= vertices.shape[0]):
+        raise ValueError(f"Face index out of range in {path}")
+
+    return vertices, faces
@@ -0,0 +1,33 @@
+import numpy as np
+
+FACE_DTYPE = np.dtype([('n', 'u1'), ('i', '<i4', (3,))])
+
+def write_binary_ply(path, vertices, faces):
+    vertices = np.ascontiguousarray(vertices, dtype='<f4')
+    faces = np.asarray(faces)
+
+    if vertices.ndim != 2 or vertices.shape[1] != 3:
+        raise ValueError(f"Invalid vertices shape: {vertices.shape}. Expected (V, 3)")
+    if faces.ndim != 2 or faces.shape[1] != 3:
+        raise ValueError(f"Invalid faces shape: {faces.shape}. Expected (F, 3)")
+
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        f"element vertex {vertices.shape[0]}\n"
+        "property float x\n"
+        "property float y\n"
+        "property float z\n"
+        f"element face {faces.shape[0]}\n"
+        "property list uchar int vertex_indices\n"
+        "end_header\n"
+    )
+
+    face_records = np.empty(faces.shape[0], dtype=FACE_DTYPE)
+    face_records['n'] = 3
+    face_records['i'] = faces
+
+    with open(path, 'wb') as f:
+        f.write(header.encode('ascii'))
+        vertices.tofile(f)
+        face_records.tofile(f)
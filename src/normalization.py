@@ -1,26 +1,46 @@
 import numpy as np
 
+def _minmax_reduce(vertices):
+    return vertices.min(axis=0), vertices.max(axis=0)
+
+def _affine_scale(values, scale, offset, out=None):
+    if out is None or out.dtype != np.float64:
+        out = np.empty(values.shape, dtype=np.float64)
+    scaled = np.multiply(values, scale, out=out, dtype=np.float64)
+    scaled += offset
+    return scaled
+
+def _residual32(vertices, offset):
+    residual = np.empty(vertices.shape, dtype=np.float32)
+    np.subtract(vertices, offset, out=residual)
+    return residual
+
 def norm_minmax(vertices):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    
     if vertices.ndim != 2 or vertices.shape[1] != 3:
         raise ValueError(f"Invalid vertices shape: {vertices.shape}. Expected (V, 3)")
     
-    v_min = vertices.min(axis=0)
-    v_max = vertices.max(axis=0)
+    v_min, v_max = _minmax_reduce(vertices)
     
     range_per_axis = v_max - v_min
     range_per_axis[range_per_axis == 0] = 1.0
     
-    normalized = (vertices - v_min) / range_per_axis
+    normalized = _residual32(vertices, v_min)
+    normalized /= range_per_axis
+    
+    v_min.setflags(write=False)
+    v_max.setflags(write=False)
     
     params = {
         'method': 'minmax',
-        'v_min': v_min.copy(),
-        'v_max': v_max.copy()
+        'v_min': v_min,
+        'v_max': v_max
     }
     
     return normalized, params
 
-def denorm_minmax(normalized, params):
+def denorm_minmax(normalized, params, inplace=False):
     if params['method'] != 'minmax':
         raise ValueError(f"Invalid method in params: {params['method']}. Expected 'minmax'")
     
@@ -30,33 +50,42 @@ def denorm_minmax(normalized, params):
     v_min = params['v_min']
     v_max = params['v_max']
     
-    reconstructed = normalized * (v_max - v_min) + v_min
+    out = normalized if inplace else None
+    reconstructed = _affine_scale(normalized, v_max - v_min, v_min, out=out)
     
     return reconstructed
 
-def norm_sphere(vertices):
-    if vertices.ndim != 2 or vertices.shape[1] != 3:
-        raise ValueError(f"Invalid vertices shape: {vertices.shape}. Expected (V, 3)")
-    
+def _sphere_normalize(vertices):
     center = vertices.mean(axis=0)
-    shifted = vertices - center
-    distances = np.linalg.norm(shifted, axis=1)
-    scale = np.max(distances)
+    normalized = _residual32(vertices, center)
+    scale = np.sqrt(np.einsum('ij,ij->i', normalized, normalized).max())
     
     if scale == 0:
         scale = 1.0
     
-    normalized = shifted / scale
+    normalized /= scale
+    
+    return normalized, center, scale
+
+def norm_sphere(vertices):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    
+    if vertices.ndim != 2 or vertices.shape[1] != 3:
+        raise ValueError(f"Invalid vertices shape: {vertices.shape}. Expected (V, 3)")
+    
+    normalized, center, scale = _sphere_normalize(vertices)
+    
+    center.setflags(write=False)
     
     params = {
         'method': 'sphere',
-        'center': center.copy(),
+        'center': center,
         'scale': float(scale)
     }
     
     return normalized, params
 
-def denorm_sphere(normalized, params):
+def denorm_sphere(normalized, params, inplace=False):
     if params['method'] != 'sphere':
         raise ValueError(f"Invalid method in params: {params['method']}. Expected 'sphere'")
     
@@ -66,10 +95,73 @@ def denorm_sphere(normalized, params):
     center = params['center']
     scale = params['scale']
     
-    reconstructed = normalized * scale + center
+    out = normalized if inplace else None
+    reconstructed = _affine_scale(normalized, scale, center, out=out)
     
     return reconstructed
 
+def _segment_bounds(offsets):
+    starts = offsets[:-1]
+    counts = np.diff(offsets)
+    
+    if np.any(counts == 0):
+        raise ValueError("Empty mesh in batch: every segment needs at least one vertex")
+    
+    return starts, counts
+
+def norm_minmax_batch(vertices, offsets):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    
+    if vertices.ndim != 2 or vertices.shape[1] != 3:
+        raise ValueError(f"Invalid vertices shape: {vertices.shape}. Expected (V, 3)")
+    
+    starts, counts = _segment_bounds(offsets)
+    
+    v_min = np.minimum.reduceat(vertices, starts, axis=0)
+    v_max = np.maximum.reduceat(vertices, starts, axis=0)
+    
+    range_per_axis = v_max - v_min
+    range_per_axis[range_per_axis == 0] = 1.0
+    
+    normalized = _residual32(vertices, np.repeat(v_min, counts, axis=0))
+    normalized /= np.repeat(range_per_axis, counts, axis=0)
+    
+    v_min.setflags(write=False)
+    v_max.setflags(write=False)
+    
+    params = [
+        {'method': 'minmax', 'v_min': v_min[i], 'v_max': v_max[i]}
+        for i in range(len(counts))
+    ]
+    
+    return normalized, params
+
+def norm_sphere_batch(vertices, offsets):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    
+    if vertices.ndim != 2 or vertices.shape[1] != 3:
+        raise ValueError(f"Invalid vertices shape: {vertices.shape}. Expected (V, 3)")
+    
+    starts, counts = _segment_bounds(offsets)
+    
+    center = np.add.reduceat(vertices, starts, axis=0) / counts[:, None]
+    normalized = _residual32(vertices, np.repeat(center, counts, axis=0))
+    
+    dist_sq = np.einsum('ij,ij->i', normalized, normalized)
+    scale = np.sqrt(np.maximum.reduceat(dist_sq, starts))
+    scale[scale == 0] = 1.0
+    
+    normalized /= np.repeat(scale, counts)[:, None]
+    
+    center.setflags(write=False)
+    
+    params = [
+        {'method': 'sphere', 'center': center[i], 'scale': float(scale[i])}
+        for i in range(len(counts))
+    ]
+    
+    return normalized, params
+
 def validate_normalization(vertices, normalized, params, method_name):
     print(f"\nValidating {method_name} normalization...")
     
@@ -79,17 +171,15 @@ def validate_normalization(vertices, normalized, params, method_name):
     print(f"  ✓ Shapes match: {vertices.shape}")
     
     if method_name == "Min-Max":
-        n_min = normalized.min(axis=0)
-        n_max = normalized.max(axis=0)
+        n_min, n_max = _minmax_reduce(normalized)
         print(f"  ✓ Normalized range: x=[{n_min[0]:.6f}, {n_max[0]:.6f}], "
               f"y=[{n_min[1]:.6f}, {n_max[1]:.6f}], z=[{n_min[2]:.6f}, {n_max[2]:.6f}]")
         
-        if np.any(n_min < -1e-6) or np.any(n_max > 1 + 1e-6):
+        if n_min.min() < -1e-6 or n_max.max() > 1 + 1e-6:
             print(f"  ✗ Warning: Values outside [0,1] range")
     
     elif method_name == "Unit Sphere":
-        distances = np.linalg.norm(normalized, axis=1)
-        max_dist = np.max(distances)
+        max_dist = np.sqrt(np.einsum('ij,ij->i', normalized, normalized).max())
         print(f"  ✓ Max distance from origin: {max_dist:.6f} (should be ≤ 1.0)")
         
         if max_dist > 1 + 1e-6:
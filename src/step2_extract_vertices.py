@@ -1,10 +1,10 @@
 import os
 import sys
-import json
 import numpy as np
-import trimesh
 from pathlib import Path
 from datetime import datetime
+from fast_obj import load_vertices_faces
+from jsonio import dump_json
 
 def list_mesh_files(input_dir='8samples'):
     input_path = Path(input_dir)
@@ -24,11 +24,8 @@ def list_mesh_files(input_dir='8samples'):
 
 def load_mesh(path):
     try:
-        mesh = trimesh.load(path, process=False)
-        vertices = mesh.vertices
-        faces = mesh.faces
-        
-        return mesh, vertices, faces
+        vertices, faces = load_vertices_faces(path)
+        return vertices, faces
     except Exception as e:
         print(f"ERROR loading {path}: {e}")
         sys.exit(1)
@@ -71,20 +68,19 @@ def compute_stats(vertices):
     return stats
 
 def print_stats(filename, stats, vertices):
-    print(f"\nFile: {filename}")
-    print(f"Number of vertices: {stats['n_vertices']}")
-    print(f"\nPer-axis statistics:")
-    print(f"  X-axis: min={stats['min']['x']:.6f}, max={stats['max']['x']:.6f}, "
-          f"mean={stats['mean']['x']:.6f}, std={stats['std']['x']:.6f}")
-    print(f"  Y-axis: min={stats['min']['y']:.6f}, max={stats['max']['y']:.6f}, "
-          f"mean={stats['mean']['y']:.6f}, std={stats['std']['y']:.6f}")
-    print(f"  Z-axis: min={stats['min']['z']:.6f}, max={stats['max']['z']:.6f}, "
-          f"mean={stats['mean']['z']:.6f}, std={stats['std']['z']:.6f}")
-    
-    print(f"\nFirst 5 vertices (sample):")
-    sample_vertices = vertices[:5]
-    for i, v in enumerate(sample_vertices):
-        print(f"  [{i}]: ({v[0]:.6f}, {v[1]:.6f}, {v[2]:.6f})")
+    lines = [
+        f"\nFile: {filename}",
+        f"Number of vertices: {stats['n_vertices']}",
+        f"\nPer-axis statistics:"
+    ]
+    for axis in ['x', 'y', 'z']:
+        lines.append(f"  {axis.upper()}-axis: min={stats['min'][axis]:.6f}, max={stats['max'][axis]:.6f}, "
+                     f"mean={stats['mean'][axis]:.6f}, std={stats['std'][axis]:.6f}")
+    
+    lines.append(f"\nFirst 5 vertices (sample):")
+    lines.extend(f"  [{i}]: ({v[0]:.6f}, {v[1]:.6f}, {v[2]:.6f})" for i, v in enumerate(vertices[:5]))
+    
+    print("\n".join(lines))
 
 def save_stats(output_path, filename, stats):
     base_name = Path(filename).stem
@@ -96,8 +92,7 @@ def save_stats(output_path, filename, stats):
         'statistics': stats
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    dump_json(output_file, output_data)
 
 def update_log(obj_files, all_stats):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -131,7 +126,7 @@ def main():
     all_stats = {}
     
     for obj_file in obj_files:
-        mesh, vertices, faces = load_mesh(obj_file)
+        vertices, faces = load_mesh(obj_file)
         
         stats = compute_stats(vertices)
         
@@ -1,13 +1,18 @@
 import os
 import sys
-import json
 import numpy as np
-import trimesh
 from pathlib import Path
 from datetime import datetime
-from normalization import norm_minmax, norm_sphere
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from normalization import norm_minmax_batch, norm_sphere_batch
+from fast_obj import load_vertices_faces
+from fast_ply import write_binary_ply
+from jsonio import dump_json
 
 BINS = 1024
+QBITS = 10
+QMASK = (1 << QBITS) - 1
 
 def list_mesh_files(input_dir='8samples'):
     input_path = Path(input_dir)
@@ -27,103 +32,141 @@ def list_mesh_files(input_dir='8samples'):
 
 def load_mesh(path):
     try:
-        mesh = trimesh.load(path, process=False)
-        vertices = mesh.vertices
-        faces = mesh.faces
-        return mesh, vertices, faces
+        vertices, faces = load_vertices_faces(path)
+        return vertices, faces
     except Exception as e:
         print(f"ERROR loading {path}: {e}")
         sys.exit(1)
 
-def quantize(normalized, bins=BINS, method='minmax'):
+def quantize(normalized, bins=BINS, method='minmax', inplace=False):
     if normalized.ndim != 2 or normalized.shape[1] != 3:
         raise ValueError(f"Invalid normalized shape: {normalized.shape}. Expected (V, 3)")
     
+    out = normalized if inplace else None
+    
     if method == 'minmax':
-        normalized01 = normalized.copy()
+        scaled = np.multiply(normalized, bins - 1, out=out)
     elif method == 'sphere':
-        normalized01 = (normalized + 1.0) / 2.0
+        scaled = np.add(normalized, 1.0, out=out)
+        scaled *= (bins - 1) / 2.0
     else:
         raise ValueError(f"Unknown method: {method}. Expected 'minmax' or 'sphere'")
     
-    q = np.floor(normalized01 * (bins - 1)).astype(np.int32)
-    q = np.clip(q, 0, bins - 1)
+    np.clip(scaled, 0, bins - 1, out=scaled)
+    q = scaled.astype(np.int32)
     
     return q
 
+def _pack_uint32(q):
+    q = q.astype(np.uint32)
+    return q[:, 0] | (q[:, 1] << QBITS) | (q[:, 2] << (2 * QBITS))
+
+def _unpack_uint32(packed):
+    shifts = np.array([0, QBITS, 2 * QBITS], dtype=np.uint32)
+    return ((packed[:, None] >> shifts) & QMASK).astype(np.int32)
+
 def dequantize(q, bins=BINS, method='minmax'):
+    if q.ndim == 1:
+        q = _unpack_uint32(q)
+    
     if q.ndim != 2 or q.shape[1] != 3:
         raise ValueError(f"Invalid quantized shape: {q.shape}. Expected (V, 3)")
     
-    dequantized01 = q.astype(np.float64) / (bins - 1)
+    inv = np.float32(1.0 / (bins - 1))
     
     if method == 'minmax':
-        normalized = dequantized01
+        normalized = q.astype(np.float32)
+        normalized *= inv
     elif method == 'sphere':
-        normalized = dequantized01 * 2.0 - 1.0
+        normalized = q.astype(np.float32)
+        normalized *= 2.0 * inv
+        normalized -= 1.0
     else:
         raise ValueError(f"Unknown method: {method}. Expected 'minmax' or 'sphere'")
     
     return normalized
 
 def save_quantized_mesh(vertices, faces, output_path, base_name, method):
-    mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
     output_file = output_path / f"{base_name}_quantized_{method}.ply"
-    mesh.export(output_file)
+    write_binary_ply(output_file, vertices, faces)
 
-def save_quantized_array(q, output_path, base_name, method):
-    output_file = output_path / f"{base_name}_quantized_{method}.npy"
-    np.save(output_file, q)
+def save_quantized_batch(batch_results, offsets, obj_files, output_path):
+    if BINS > (1 << QBITS):
+        raise ValueError(f"BINS={BINS} does not fit in {QBITS} bits per axis")
+    
+    for method_name, (q, _) in batch_results.items():
+        output_file = output_path / f"quantized_{method_name}_q10.npy"
+        np.save(output_file, _pack_uint32(q))
+    
+    index = {
+        Path(obj_file).stem: [int(offsets[i]), int(offsets[i + 1])]
+        for i, obj_file in enumerate(obj_files)
+    }
+    dump_json(output_path / "quantized_index.json", index)
 
 def save_quantized_sample(q, output_path, base_name, method):
     output_file = output_path / f"{base_name}_quantized_{method}_sample.txt"
     
+    lines = [
+        f"Quantized coordinates sample (first 10 vertices)",
+        f"Method: {method}, BINS: {BINS}",
+        f"Valid range: [0, {BINS-1}]",
+        "=" * 60 + "\n"
+    ]
+    lines.extend(f"[{i}]: ({v[0]:4d}, {v[1]:4d}, {v[2]:4d})" for i, v in enumerate(q[:10]))
+    
     with open(output_file, 'w') as f:
-        f.write(f"Quantized coordinates sample (first 10 vertices)\n")
-        f.write(f"Method: {method}, BINS: {BINS}\n")
-        f.write(f"Valid range: [0, {BINS-1}]\n")
-        f.write("=" * 60 + "\n\n")
-        
-        sample_size = min(10, q.shape[0])
-        for i in range(sample_size):
-            f.write(f"[{i}]: ({q[i, 0]:4d}, {q[i, 1]:4d}, {q[i, 2]:4d})\n")
+        f.write("\n".join(lines) + "\n")
+
+def save_faces(faces, output_path, base_name):
+    output_file = output_path / f"{base_name}_faces.npy"
+    np.save(output_file, faces.astype(np.int32))
 
 def save_normalization_params(params, output_path, base_name, method):
     output_file = output_path / f"{base_name}_params_{method}.json"
+    dump_json(output_file, params)
+
+def load_mesh_batch(obj_files, executor):
+    meshes = list(executor.map(load_mesh, obj_files))
+    vertex_list = [vertices for vertices, _ in meshes]
+    faces_list = [faces for _, faces in meshes]
     
-    params_serializable = {}
-    for key, value in params.items():
-        if isinstance(value, np.ndarray):
-            params_serializable[key] = value.tolist()
-        else:
-            params_serializable[key] = value
+    all_vertices = np.concatenate(vertex_list)
+    offsets = np.cumsum([0] + [vertices.shape[0] for vertices in vertex_list])
     
-    with open(output_file, 'w') as f:
-        json.dump(params_serializable, f, indent=2)
+    return all_vertices, offsets, faces_list
+
+def quantize_batch(all_vertices, offsets):
+    methods = [
+        ('minmax', norm_minmax_batch),
+        ('sphere', norm_sphere_batch)
+    ]
+    
+    results = {}
+    for method_name, norm_func in methods:
+        normalized, params_list = norm_func(all_vertices, offsets)
+        q = quantize(normalized, bins=BINS, method=method_name, inplace=True)
+        results[method_name] = (q, params_list)
+    
+    return results
 
-def process_mesh_file(obj_file, output_path):
+def process_mesh_file(obj_file, faces, method_results, output_path):
     filename = Path(obj_file).name
     base_name = Path(obj_file).stem
     
     print(f"\nProcessing: {filename}")
     
-    mesh, vertices, faces = load_mesh(obj_file)
+    n_vertices = next(iter(method_results.values()))[0].shape[0]
     
     stats = {
         'filename': filename,
-        'n_vertices': vertices.shape[0],
+        'n_vertices': n_vertices,
         'methods': {}
     }
     
-    methods = [
-        ('minmax', norm_minmax),
-        ('sphere', norm_sphere)
-    ]
+    save_faces(faces, output_path, base_name)
     
-    for method_name, norm_func in methods:
-        normalized, params = norm_func(vertices)
-        q = quantize(normalized, bins=BINS, method=method_name)
-        
+    for method_name, (q, params) in method_results.items():
         q_min = q.min()
         q_max = q.max()
         
@@ -134,9 +177,9 @@ def process_mesh_file(obj_file, output_path):
         dequantized = dequantize(q, bins=BINS, method=method_name)
         
         save_quantized_mesh(dequantized, faces, output_path, base_name, method_name)
-        save_quantized_array(q, output_path, base_name, method_name)
         save_quantized_sample(q, output_path, base_name, method_name)
-        save_normalization_params(params, output_path, base_name, method_name)
+        save_normalization_params({**params, 'n_vertices': int(n_vertices)},
+                                  output_path, base_name, method_name)
         
         stats['methods'][method_name] = {
             'q_min': int(q_min),
@@ -176,11 +219,22 @@ def main():
     output_path = Path('outputs')
     output_path.mkdir(exist_ok=True)
     
-    all_stats = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        all_vertices, offsets, faces_list = load_mesh_batch(obj_files, executor)
+        batch_results = quantize_batch(all_vertices, offsets)
+        
+        mesh_results = [
+            {
+                method_name: (q[offsets[i]:offsets[i + 1]], params_list[i])
+                for method_name, (q, params_list) in batch_results.items()
+            }
+            for i in range(len(obj_files))
+        ]
+        
+        all_stats = list(executor.map(partial(process_mesh_file, output_path=output_path),
+                                      obj_files, faces_list, mesh_results))
     
-    for obj_file in obj_files:
-        stats = process_mesh_file(obj_file, output_path)
-        all_stats.append(stats)
+    save_quantized_batch(batch_results, offsets, obj_files, output_path)
     
     update_log(all_stats)
     
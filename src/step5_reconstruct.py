@@ -1,12 +1,15 @@
 import os
 import sys
-import json
 import numpy as np
-import trimesh
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
 
 from normalization import denorm_minmax, denorm_sphere
+from step4_quantize import _unpack_uint32
+from fast_ply import write_binary_ply
+from jsonio import load_json
 
 BINS = 1024
 
@@ -25,17 +28,24 @@ def list_mesh_files(input_dir='8samples'):
     
     return obj_files
 
-def load_mesh(path):
-    try:
-        mesh = trimesh.load(path, process=False)
-        vertices = mesh.vertices
-        faces = mesh.faces
-        return mesh, vertices, faces
-    except Exception as e:
-        print(f"ERROR loading {path}: {e}")
-        sys.exit(1)
+@lru_cache(maxsize=None)
+def load_quantized_index(output_path):
+    index_file = output_path / "quantized_index.json"
+    if not index_file.exists():
+        return {}
+    return load_json(index_file)
 
 def load_quantized_array(output_path, base_name, method):
+    index = load_quantized_index(output_path)
+    if index:
+        batch_file = output_path / f"quantized_{method}_q10.npy"
+        if base_name not in index or not batch_file.exists():
+            print(f"ERROR: {base_name} ({method}) missing from packed quantized data: {batch_file}")
+            print(f"Please re-run Step 4.")
+            sys.exit(1)
+        start, end = index[base_name]
+        return np.load(batch_file, mmap_mode='r')[start:end]
+    
     npy_file = output_path / f"{base_name}_quantized_{method}.npy"
     if not npy_file.exists():
         print(f"ERROR: Quantized array not found: {npy_file}")
@@ -44,66 +54,79 @@ def load_quantized_array(output_path, base_name, method):
     q = np.load(npy_file)
     return q
 
+def load_faces(output_path, base_name):
+    npy_file = output_path / f"{base_name}_faces.npy"
+    if not npy_file.exists():
+        print(f"ERROR: Cached faces not found: {npy_file}")
+        sys.exit(1)
+    
+    faces = np.load(npy_file)
+    return faces
+
 def load_normalization_params(output_path, base_name, method):
     json_file = output_path / f"{base_name}_params_{method}.json"
     if not json_file.exists():
         print(f"ERROR: Parameters file not found: {json_file}")
         sys.exit(1)
     
-    with open(json_file, 'r') as f:
-        params = json.load(f)
+    params = load_json(json_file)
     
     if 'v_min' in params:
-        params['v_min'] = np.array(params['v_min'])
+        params['v_min'] = np.array(params['v_min'], dtype=np.float64)
     if 'v_max' in params:
-        params['v_max'] = np.array(params['v_max'])
+        params['v_max'] = np.array(params['v_max'], dtype=np.float64)
     if 'center' in params:
-        params['center'] = np.array(params['center'])
+        params['center'] = np.array(params['center'], dtype=np.float64)
     
     return params
 
 def dequantize(q, bins=BINS, method='minmax'):
+    if q.ndim == 1:
+        q = _unpack_uint32(q)
+    
     if q.ndim != 2 or q.shape[1] != 3:
         raise ValueError(f"Invalid quantized shape: {q.shape}. Expected (V, 3)")
-    dequantized01 = q.astype(np.float64) / (bins - 1)
+    inv = np.float32(1.0 / (bins - 1))
     
     if method == 'minmax':
-        normalized = dequantized01
+        normalized = q.astype(np.float32)
+        normalized *= inv
     elif method == 'sphere':
-        normalized = dequantized01 * 2.0 - 1.0
+        normalized = q.astype(np.float32)
+        normalized *= 2.0 * inv
+        normalized -= 1.0
     else:
         raise ValueError(f"Unknown method: {method}. Expected 'minmax' or 'sphere'")
     
     return normalized
 
-def denormalize(normalized, params):
+def denormalize(normalized, params, inplace=False):
     method = params['method']
     if method == 'minmax':
-        return denorm_minmax(normalized, params)
+        return denorm_minmax(normalized, params, inplace=inplace)
     elif method == 'sphere':
-        return denorm_sphere(normalized, params)
+        return denorm_sphere(normalized, params, inplace=inplace)
     else:
         raise ValueError(f"Unknown method: {method}")
 
 def save_reconstructed_mesh(vertices, faces, output_path, base_name, method):
-    mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
     output_file = output_path / f"{base_name}_reconstructed_{method}.ply"
-    mesh.export(output_file)
+    write_binary_ply(output_file, vertices, faces)
     
     print(f"  ✓ Saved reconstructed mesh: {output_file}")
     return output_file
 
 def save_sample_vertices(vertices, output_path, base_name, method):
     output_file = output_path / f"{base_name}_reconstructed_{method}_sample.txt"
+    lines = [
+        f"Reconstructed vertices sample (first 5 vertices)",
+        f"Method: {method}",
+        "=" * 60 + "\n"
+    ]
+    lines.extend(f"[{i}]: ({v[0]:.6f}, {v[1]:.6f}, {v[2]:.6f})" for i, v in enumerate(vertices[:5]))
+    
     with open(output_file, 'w') as f:
-        f.write(f"Reconstructed vertices sample (first 5 vertices)\n")
-        f.write(f"Method: {method}\n")
-        f.write("=" * 60 + "\n\n")
-        
-        sample_size = min(5, vertices.shape[0])
-        for i in range(sample_size):
-            v = vertices[i]
-            f.write(f"[{i}]: ({v[0]:.6f}, {v[1]:.6f}, {v[2]:.6f})\n")
+        f.write("\n".join(lines) + "\n")
     
     print(f"  ✓ Saved reconstructed sample: {output_file}")
 
@@ -114,12 +137,12 @@ def process_mesh_reconstruction(obj_file, output_path):
     print(f"Reconstructing: {filename}")
     print(f"{'='*60}")
     
-    mesh, original_vertices, faces = load_mesh(obj_file)
-    print(f"✓ Loaded original mesh with {original_vertices.shape[0]} vertices")
+    faces = load_faces(output_path, base_name)
+    print(f"✓ Loaded cached faces ({faces.shape[0]} faces)")
     
     stats = {
         'filename': filename,
-        'n_vertices': original_vertices.shape[0],
+        'n_vertices': 0,
         'methods': {}
     }
     
@@ -131,30 +154,32 @@ def process_mesh_reconstruction(obj_file, output_path):
         q = load_quantized_array(output_path, base_name, method_name)
         print(f"  ✓ Loaded quantized array (shape: {q.shape})")
         
-        if q.shape != original_vertices.shape:
-            print(f"  ✗ ERROR: Shape mismatch!")
-            print(f"    Original: {original_vertices.shape}, Quantized: {q.shape}")
-            sys.exit(1)
-        
         params = load_normalization_params(output_path, base_name, method_name)
         print(f"  ✓ Loaded normalization parameters (method: {params['method']})")
         
+        n_vertices = params.get('n_vertices', q.shape[0])
+        if q.shape[0] != n_vertices:
+            print(f"  ✗ ERROR: Shape mismatch!")
+            print(f"    Original: ({n_vertices}, 3), Quantized: {q.shape}")
+            sys.exit(1)
+        stats['n_vertices'] = n_vertices
+        
         normalized = dequantize(q, bins=BINS, method=method_name)
         print(f"  ✓ Dequantized to normalized coordinates (shape: {normalized.shape})")
         
-        if method_name == 'minmax':
+        if os.environ.get('VERBOSE'):
             n_min, n_max = normalized.min(), normalized.max()
-            print(f"    Normalized range: [{n_min:.6f}, {n_max:.6f}] (expected: [0, 1])")
-        else:
-            n_min, n_max = normalized.min(), normalized.max()
-            max_dist = np.max(np.linalg.norm(normalized, axis=1))
-            print(f"    Normalized range: [{n_min:.6f}, {n_max:.6f}]")
-            print(f"    Max distance from origin: {max_dist:.6f} (expected: ≤ 1)")
+            if method_name == 'minmax':
+                print(f"    Normalized range: [{n_min:.6f}, {n_max:.6f}] (expected: [0, 1])")
+            else:
+                max_dist = np.sqrt(np.einsum('ij,ij->i', normalized, normalized).max())
+                print(f"    Normalized range: [{n_min:.6f}, {n_max:.6f}]")
+                print(f"    Max distance from origin: {max_dist:.6f} (expected: ≤ 1)")
         
-        reconstructed = denormalize(normalized, params)
+        reconstructed = denormalize(normalized, params, inplace=True)
         print(f"  ✓ Denormalized to original scale (shape: {reconstructed.shape})")
         
-        if reconstructed.shape != original_vertices.shape:
+        if reconstructed.shape != (n_vertices, 3):
             print(f"  ✗ ERROR: Reconstructed shape mismatch!")
             sys.exit(1)
         
@@ -209,11 +234,9 @@ def main():
         print(f"Please run Step 4 first to generate quantized data.")
         sys.exit(1)
     
-    all_stats = []
-    
-    for obj_file in obj_files:
-        stats = process_mesh_reconstruction(obj_file, output_path)
-        all_stats.append(stats)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        all_stats = list(executor.map(partial(process_mesh_reconstruction, output_path=output_path),
+                                      obj_files))
     
     update_log(all_stats)
     
@@ -1,13 +1,19 @@
 import os
 import sys
-import json
 import numpy as np
-import trimesh
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from fast_obj import load_vertices_faces
+from fast_hist import plot_histogram
+from jsonio import dump_json
 
 ERROR_THRESHOLD = 1e-3
+PLOT_DPI = 100
+SORTED_PLOT_POINTS = 4000
 
 def list_mesh_files(input_dir='8samples'):
     input_path = Path(input_dir)
@@ -15,8 +21,7 @@ def list_mesh_files(input_dir='8samples'):
         print(f"\nERROR: Input directory '{input_dir}' does not exist!")
         sys.exit(1)
     
-    obj_files = list(input_path.glob('*.obj'))
-    obj_files = [str(f) for f in obj_files]
+    obj_files = [(str(f), f.name, f.stem) for f in input_path.glob('*.obj')]
     
     if len(obj_files) == 0:
         print(f"\nERROR: No .obj files found in {input_dir}/ folder!")
@@ -26,64 +31,40 @@ def list_mesh_files(input_dir='8samples'):
 
 def load_mesh(path):
     try:
-        mesh = trimesh.load(path, process=False)
-        vertices = mesh.vertices
-        faces = mesh.faces
-        return mesh, vertices, faces
+        vertices, faces = load_vertices_faces(path)
+        return vertices, faces
     except Exception as e:
         print(f"ERROR loading {path}: {e}")
         sys.exit(1)
 
 def load_reconstructed_mesh(output_path, base_name, method):
-    from step4_quantize import dequantize
-    from normalization import denorm_minmax, denorm_sphere
-    npy_file = output_path / f"{base_name}_quantized_{method}.npy"
-    if not npy_file.exists():
-        print(f"ERROR: Quantized array not found: {npy_file}")
-        sys.exit(1)
-    
-    q = np.load(npy_file)
-    
-    json_file = output_path / f"{base_name}_params_{method}.json"
-    if not json_file.exists():
-        print(f"ERROR: Parameters file not found: {json_file}")
-        sys.exit(1)
-    
-    with open(json_file, 'r') as f:
-        params = json.load(f)
-    
-    if 'v_min' in params:
-        params['v_min'] = np.array(params['v_min'])
-    if 'v_max' in params:
-        params['v_max'] = np.array(params['v_max'])
-    if 'center' in params:
-        params['center'] = np.array(params['center'])
-    
-    normalized = dequantize(q, bins=1024, method=method)
+    from step5_reconstruct import BINS, load_quantized_array, load_normalization_params, dequantize, denormalize
     
-    if method == 'minmax':
-        reconstructed = denorm_minmax(normalized, params)
-    elif method == 'sphere':
-        reconstructed = denorm_sphere(normalized, params)
-    else:
-        raise ValueError(f"Unknown method: {method}")
-    
-    return reconstructed
+    q = load_quantized_array(output_path, base_name, method)
+    params = load_normalization_params(output_path, base_name, method)
+    normalized = dequantize(q, bins=BINS, method=method)
+    return denormalize(normalized, params, inplace=True)
 
 def compute_errors(original, reconstructed):
     if original.shape != reconstructed.shape:
         raise ValueError(f"Shape mismatch: {original.shape} vs {reconstructed.shape}")
     diff = original - reconstructed
+    dx, dy, dz = (np.ascontiguousarray(diff[:, axis]) for axis in range(3))
+    per_vertex_abs_error = np.abs(diff, out=diff)
     
-    mse_total = np.mean(diff ** 2)
-    mae_total = np.mean(np.abs(diff))
+    for d in (dx, dy, dz):
+        np.multiply(d, d, out=d)
     
-    mse_per_axis = np.mean(diff ** 2, axis=0)
-    mae_per_axis = np.mean(np.abs(diff), axis=0)
+    mse_per_axis = np.array([dx.mean(), dy.mean(), dz.mean()])
+    mae_per_axis = per_vertex_abs_error.mean(axis=0)
     
-    per_vertex_error = np.linalg.norm(diff, axis=1)
+    mse_total = mse_per_axis.mean()
+    mae_total = mae_per_axis.mean()
     
-    per_vertex_abs_error = np.abs(diff)
+    per_vertex_error = dx
+    per_vertex_error += dy
+    per_vertex_error += dz
+    np.sqrt(per_vertex_error, out=per_vertex_error)
     
     max_error = np.max(per_vertex_error)
     min_error = np.min(per_vertex_error)
@@ -111,6 +92,14 @@ def compute_errors(original, reconstructed):
     
     return metrics
 
+def save_original_vertices(output_path, base_name, vertices):
+    output_file = output_path / f"{base_name}_orig.npy"
+    np.save(output_file, np.asarray(vertices, dtype=np.float64))
+
+def save_reconstructed_vertices(output_path, base_name, method, vertices):
+    output_file = output_path / f"{base_name}_recon_{method}.npy"
+    np.save(output_file, np.asarray(vertices, dtype=np.float64))
+
 def save_metrics(output_path, base_name, method, metrics):
     output_file = output_path / f"{base_name}_metrics_{method}.json"
     metrics_serializable = {
@@ -123,11 +112,15 @@ def save_metrics(output_path, base_name, method, metrics):
         'std_error': metrics['std_error']
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(metrics_serializable, f, indent=2)
+    dump_json(output_file, metrics_serializable)
     
     print(f"  ✓ Saved metrics: {output_file}")
 
+def _reuse_figure(figsize):
+    fig = plt.figure(num='step6_plot', clear=True)
+    fig.set_size_inches(figsize)
+    return fig
+
 def plot_mse_per_axis(metrics, output_path, base_name, method):
     output_file = output_path / f"{base_name}_mse_axis_{method}.png"
     axes = ['X', 'Y', 'Z']
@@ -137,7 +130,7 @@ def plot_mse_per_axis(metrics, output_path, base_name, method):
         metrics['mse_per_axis']['z']
     ]
     
-    plt.figure(figsize=(8, 6))
+    _reuse_figure((8, 6))
     bars = plt.bar(axes, mse_values, color=['#FF6B6B', '#4ECDC4', '#45B7D1'], alpha=0.8)
     
     for bar, value in zip(bars, mse_values):
@@ -153,8 +146,7 @@ def plot_mse_per_axis(metrics, output_path, base_name, method):
     plt.grid(axis='y', alpha=0.3, linestyle='--')
     plt.tight_layout()
     
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig(output_file, dpi=PLOT_DPI, bbox_inches='tight')
     
     print(f"  ✓ Saved MSE plot: {output_file}")
 
@@ -162,8 +154,8 @@ def plot_error_histogram(metrics, output_path, base_name, method):
     output_file = output_path / f"{base_name}_error_hist_{method}.png"
     errors = metrics['per_vertex_error']
     
-    plt.figure(figsize=(10, 6))
-    plt.hist(errors, bins=50, color='#6C5CE7', alpha=0.7, edgecolor='black', linewidth=0.5)
+    _reuse_figure((10, 6))
+    plot_histogram(plt.gca(), errors, 50, color='#6C5CE7', alpha=0.7, edgecolor='black', linewidth=0.5)
     
     mean_error = np.mean(errors)
     median_error = np.median(errors)
@@ -178,21 +170,27 @@ def plot_error_histogram(metrics, output_path, base_name, method):
     plt.grid(axis='y', alpha=0.3, linestyle='--')
     plt.tight_layout()
     
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig(output_file, dpi=PLOT_DPI, bbox_inches='tight')
     
     print(f"  ✓ Saved histogram: {output_file}")
 
 def plot_error_sorted(metrics, output_path, base_name, method):
     output_file = output_path / f"{base_name}_error_sorted_{method}.png"
     errors = metrics['per_vertex_error']
+    n_errors = len(errors)
     sorted_errors = np.sort(errors)
     
-    plt.figure(figsize=(10, 6))
-    plt.plot(sorted_errors, color='#FF6B6B', linewidth=1.5, alpha=0.8)
+    if n_errors > SORTED_PLOT_POINTS:
+        plot_index = np.linspace(0, n_errors - 1, SORTED_PLOT_POINTS, dtype=np.int64)
+    else:
+        plot_index = np.arange(n_errors)
+    
+    _reuse_figure((10, 6))
+    plt.plot(plot_index, sorted_errors[plot_index], color='#FF6B6B', linewidth=1.5, alpha=0.8)
     
     mean_error = np.mean(errors)
-    p95_error = np.percentile(errors, 95)
+    k = min(int(0.95 * n_errors), n_errors - 1)
+    p95_error = sorted_errors[k]
     plt.axhline(mean_error, color='blue', linestyle='--', linewidth=2, label=f'Mean: {mean_error:.6f}')
     plt.axhline(p95_error, color='orange', linestyle='--', linewidth=2, label=f'95th percentile: {p95_error:.6f}')
     
@@ -204,8 +202,7 @@ def plot_error_sorted(metrics, output_path, base_name, method):
     plt.grid(alpha=0.3, linestyle='--')
     plt.tight_layout()
     
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.savefig(output_file, dpi=PLOT_DPI, bbox_inches='tight')
     
     print(f"  ✓ Saved sorted error plot: {output_file}")
 
@@ -225,15 +222,15 @@ def print_metrics(filename, method, metrics):
     else:
         print(f"  ✓ MSE is within acceptable threshold")
 
-def process_mesh_metrics(obj_file, output_path):
-    filename = Path(obj_file).name
-    base_name = Path(obj_file).stem
+def process_mesh_metrics(mesh_file, output_path):
+    obj_file, filename, base_name = mesh_file
     print(f"\n{'='*60}")
     print(f"Computing metrics: {filename}")
     print(f"{'='*60}")
     
-    mesh, original_vertices, faces = load_mesh(obj_file)
+    original_vertices, faces = load_mesh(obj_file)
     print(f"✓ Loaded original mesh with {original_vertices.shape[0]} vertices")
+    save_original_vertices(output_path, base_name, original_vertices)
     
     stats = {
         'filename': filename,
@@ -248,6 +245,7 @@ def process_mesh_metrics(obj_file, output_path):
         
         reconstructed_vertices = load_reconstructed_mesh(output_path, base_name, method_name)
         print(f"  ✓ Loaded reconstructed mesh (shape: {reconstructed_vertices.shape})")
+        save_reconstructed_vertices(output_path, base_name, method_name, reconstructed_vertices)
         
         metrics = compute_errors(original_vertices, reconstructed_vertices)
         
@@ -270,48 +268,58 @@ def process_mesh_metrics(obj_file, output_path):
 
 def create_comparison_summary(all_stats, output_path):
     output_file = output_path / "comparison_summary.txt"
-    with open(output_file, 'w') as f:
-        f.write("=" * 80 + "\n")
-        f.write("RECONSTRUCTION ERROR COMPARISON SUMMARY\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write(f"{'Mesh':<20} {'Method':<10} {'MSE (total)':<15} {'MAE (total)':<15} {'Max Error':<15}\n")
-        f.write("-" * 80 + "\n")
-        
-        for stat in all_stats:
-            for method_name, method_stats in stat['methods'].items():
-                f.write(f"{stat['filename']:<20} {method_name.upper():<10} "
-                       f"{method_stats['mse_total']:<15.10f} "
-                       f"{method_stats['mae_total']:<15.10f} "
-                       f"{method_stats['max_error']:<15.10f}\n")
-            f.write("\n")
-        
-        f.write("=" * 80 + "\n")
+    parts = [
+        "=" * 80 + "\n",
+        "RECONSTRUCTION ERROR COMPARISON SUMMARY\n",
+        "=" * 80 + "\n\n",
+        f"{'Mesh':<20} {'Method':<10} {'MSE (total)':<15} {'MAE (total)':<15} {'Max Error':<15}\n",
+        "-" * 80 + "\n"
+    ]
+    
+    for stat in all_stats:
+        for method_name, method_stats in stat['methods'].items():
+            parts.append(f"{stat['filename']:<20} {method_name.upper():<10} "
+                         f"{method_stats['mse_total']:<15.10f} "
+                         f"{method_stats['mae_total']:<15.10f} "
+                         f"{method_stats['max_error']:<15.10f}\n")
+        parts.append("\n")
+    
+    parts.append("=" * 80 + "\n")
+    output_file.write_text(''.join(parts))
     
     print(f"\n✓ Created comparison summary: {output_file}")
 
 def update_log(all_stats):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_path = Path('logs') / f'step6_{timestamp}.log'
-    with open(log_path, 'w') as f:
-        f.write(f"Step 6 - Error Metrics - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(f"Computed metrics for {len(all_stats)} mesh files\n\n")
+    parts = [
+        f"Step 6 - Error Metrics - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        "=" * 60 + "\n\n",
+        f"Computed metrics for {len(all_stats)} mesh files\n\n"
+    ]
+    
+    for stat in all_stats:
+        parts.append(f"File: {stat['filename']}\n"
+                     f"  Vertices: {stat['n_vertices']}\n")
         
-        for stat in all_stats:
-            f.write(f"File: {stat['filename']}\n")
-            f.write(f"  Vertices: {stat['n_vertices']}\n")
-            
-            for method_name, method_stats in stat['methods'].items():
-                f.write(f"  Method: {method_name}\n")
-                f.write(f"    MSE: {method_stats['mse_total']:.10f}\n")
-                f.write(f"    MAE: {method_stats['mae_total']:.10f}\n")
-                f.write(f"    Max Error: {method_stats['max_error']:.10f}\n")
-            
-            f.write("\n")
+        for method_name, method_stats in stat['methods'].items():
+            parts.append(f"  Method: {method_name}\n"
+                         f"    MSE: {method_stats['mse_total']:.10f}\n"
+                         f"    MAE: {method_stats['mae_total']:.10f}\n"
+                         f"    Max Error: {method_stats['max_error']:.10f}\n")
+        
+        parts.append("\n")
+    
+    log_path.write_text(''.join(parts))
     
     print(f"\n✓ Log file created: {log_path}")
 
+def _warm_mpl():
+    fig, ax = plt.subplots()
+    ax.text(0, 0, 'x')
+    fig.canvas.draw()
+    plt.close(fig)
+
 def main():
     print("=" * 60)
     print("STEP 6 — Compute Error Metrics and Per-Axis Error Plots")
@@ -335,11 +343,16 @@ def main():
         print(f"Please run Step 5 first to generate reconstructed meshes.")
         sys.exit(1)
     
-    all_stats = []
+    all_stats = [None] * len(obj_files)
     
-    for obj_file in obj_files:
-        stats = process_mesh_metrics(obj_file, output_path)
-        all_stats.append(stats)
+    with ProcessPoolExecutor(max_workers=min(len(obj_files), os.cpu_count() or 1),
+                             initializer=_warm_mpl) as executor:
+        futures = {executor.submit(process_mesh_metrics, mesh_file, output_path): i
+                   for i, mesh_file in enumerate(obj_files)}
+        for future in as_completed(futures):
+            stats = future.result()
+            all_stats[futures[future]] = stats
+            print(f"\n✓ Finished metrics: {stats['filename']}")
     
     create_comparison_summary(all_stats, output_path)
     
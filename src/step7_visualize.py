@@ -1,11 +1,20 @@
 import os
 import sys
-import json
 import numpy as np
 import trimesh
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from pathlib import Path
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from fast_obj import load_vertices_faces
+from fast_hist import plot_histogram
+from jsonio import dump_json, load_json
+
+HEXBIN_GRIDSIZE = 80
+GEOM_CACHE_FILE = '_mesh_geom_cache.json'
 
 def list_mesh_files(input_dir='8samples'):
     input_path = Path(input_dir)
@@ -13,8 +22,7 @@ def list_mesh_files(input_dir='8samples'):
         print(f"\nERROR: Input directory '{input_dir}' does not exist!")
         sys.exit(1)
     
-    obj_files = list(input_path.glob('*.obj'))
-    obj_files = [str(f) for f in obj_files]
+    obj_files = [(str(f), f.name, f.stem) for f in input_path.glob('*.obj')]
     
     if len(obj_files) == 0:
         print(f"\nERROR: No .obj files found in {input_dir}/ folder!")
@@ -24,58 +32,96 @@ def list_mesh_files(input_dir='8samples'):
 
 def load_mesh(path):
     try:
-        mesh = trimesh.load(path, process=False)
+        vertices, faces = load_vertices_faces(path)
+        mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
         return mesh
     except Exception as e:
         print(f"ERROR loading {path}: {e}")
         sys.exit(1)
 
-def load_reconstructed_vertices(output_path, base_name, method):
-    from step4_quantize import dequantize
-    from normalization import denorm_minmax, denorm_sphere
-    
-    npy_file = output_path / f"{base_name}_quantized_{method}.npy"
-    if not npy_file.exists():
-        print(f"ERROR: Quantized array not found: {npy_file}")
-        sys.exit(1)
-    
-    q = np.load(npy_file)
-    
-    json_file = output_path / f"{base_name}_params_{method}.json"
-    if not json_file.exists():
-        print(f"ERROR: Parameters file not found: {json_file}")
-        sys.exit(1)
-    
-    with open(json_file, 'r') as f:
-        params = json.load(f)
-    
-    if 'v_min' in params:
-        params['v_min'] = np.array(params['v_min'])
-    if 'v_max' in params:
-        params['v_max'] = np.array(params['v_max'])
-    if 'center' in params:
-        params['center'] = np.array(params['center'])
+def _reconstruct_vertices(output_path, base_name, method):
+    from step5_reconstruct import BINS, load_quantized_array, load_normalization_params, dequantize, denormalize
     
-    normalized = dequantize(q, bins=1024, method=method)
-    
-    if method == 'minmax':
-        reconstructed = denorm_minmax(normalized, params)
-    elif method == 'sphere':
-        reconstructed = denorm_sphere(normalized, params)
-    else:
-        raise ValueError(f"Unknown method: {method}")
+    q = load_quantized_array(output_path, base_name, method)
+    params = load_normalization_params(output_path, base_name, method)
+    normalized = dequantize(q, bins=BINS, method=method)
+    return denormalize(normalized, params, inplace=True)
+
+def is_newer_than(cached_file, *sources):
+    try:
+        cached_mtime = os.stat(cached_file).st_mtime_ns
+    except OSError:
+        return False
+    
+    for source in sources:
+        try:
+            if os.stat(source).st_mtime_ns > cached_mtime:
+                return False
+        except OSError:
+            continue
+    return True
+
+def load_cached_original(output_path, base_name, obj_file):
+    orig_file = output_path / f"{base_name}_orig.npy"
+    faces_file = output_path / f"{base_name}_faces.npy"
+    if not (is_newer_than(orig_file, obj_file) and is_newer_than(faces_file, obj_file)):
+        return None
+    
+    vertices = np.load(orig_file, mmap_mode='r')
+    n_faces = np.load(faces_file, mmap_mode='r').shape[0]
+    return vertices, n_faces
+
+def load_reconstructed_vertices(output_path, base_name, method):
+    cached_file = output_path / f"{base_name}_recon_{method}.npy"
+    sources = (output_path / f"quantized_{method}_q10.npy",
+               output_path / f"{base_name}_quantized_{method}.npy",
+               output_path / f"{base_name}_params_{method}.json")
+    if is_newer_than(cached_file, *sources):
+        return np.load(cached_file, mmap_mode='r')
+    
+    return _reconstruct_vertices(output_path, base_name, method)
+
+def load_geom_cache(output_path):
+    cache_file = output_path / GEOM_CACHE_FILE
+    if not cache_file.exists():
+        return {}
     
-    return reconstructed
+    try:
+        return load_json(cache_file)
+    except ValueError:
+        return {}
+
+def save_geom_cache(output_path, all_stats):
+    cache = {stat['base_name']: stat['geometry'] for stat in all_stats}
+    dump_json(output_path / GEOM_CACHE_FILE, cache)
+
+def cached_geometry(obj_file, base_name, geom_cache):
+    st = os.stat(obj_file)
+    cached = (geom_cache or {}).get(base_name)
+    if cached and cached.get('mtime_ns') == st.st_mtime_ns and cached.get('size') == st.st_size:
+        return cached
+    return None
+
+def mesh_geometry(mesh, obj_file):
+    st = os.stat(obj_file)
+    return {
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'volume': float(mesh.volume),
+        'area': float(mesh.area)
+    }
 
-def create_mesh_info_plot(mesh, title, output_file):
-    vertices = mesh.vertices
+def create_mesh_info_plot(vertices, n_faces, geometry, title, output_file):
+    bb_min = vertices.min(axis=0)
+    bb_max = vertices.max(axis=0)
+    centroid = vertices.mean(axis=0)
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
     fig.suptitle(title, fontsize=16, fontweight='bold')
     
     ax = axes[0, 0]
-    ax.hist(vertices[:, 0], bins=30, alpha=0.7, label='X', color='#FF6B6B')
-    ax.hist(vertices[:, 1], bins=30, alpha=0.7, label='Y', color='#4ECDC4')
-    ax.hist(vertices[:, 2], bins=30, alpha=0.7, label='Z', color='#45B7D1')
+    plot_histogram(ax, vertices[:, 0], 30, alpha=0.7, label='X', color='#FF6B6B')
+    plot_histogram(ax, vertices[:, 1], 30, alpha=0.7, label='Y', color='#4ECDC4')
+    plot_histogram(ax, vertices[:, 2], 30, alpha=0.7, label='Z', color='#45B7D1')
     ax.set_xlabel('Coordinate Value', fontweight='bold')
     ax.set_ylabel('Frequency', fontweight='bold')
     ax.set_title('Vertex Distribution per Axis', fontweight='bold')
@@ -83,22 +129,22 @@ def create_mesh_info_plot(mesh, title, output_file):
     ax.grid(alpha=0.3)
     
     ax = axes[0, 1]
-    scatter = ax.scatter(vertices[:, 0], vertices[:, 1], c=vertices[:, 2], 
-                        cmap='viridis', s=1, alpha=0.6)
+    hb = ax.hexbin(vertices[:, 0], vertices[:, 1], C=vertices[:, 2], 
+                   gridsize=HEXBIN_GRIDSIZE, cmap='viridis')
     ax.set_xlabel('X', fontweight='bold')
     ax.set_ylabel('Y', fontweight='bold')
     ax.set_title('XY Projection (colored by Z)', fontweight='bold')
     ax.grid(alpha=0.3)
-    plt.colorbar(scatter, ax=ax, label='Z value')
+    plt.colorbar(hb, ax=ax, label='Z value')
     
     ax = axes[1, 0]
-    scatter = ax.scatter(vertices[:, 0], vertices[:, 2], c=vertices[:, 1], 
-                        cmap='plasma', s=1, alpha=0.6)
+    hb = ax.hexbin(vertices[:, 0], vertices[:, 2], C=vertices[:, 1], 
+                   gridsize=HEXBIN_GRIDSIZE, cmap='plasma')
     ax.set_xlabel('X', fontweight='bold')
     ax.set_ylabel('Z', fontweight='bold')
     ax.set_title('XZ Projection (colored by Y)', fontweight='bold')
     ax.grid(alpha=0.3)
-    plt.colorbar(scatter, ax=ax, label='Y value')
+    plt.colorbar(hb, ax=ax, label='Y value')
     
     ax = axes[1, 1]
     ax.axis('off')
@@ -106,15 +152,15 @@ def create_mesh_info_plot(mesh, title, output_file):
     stats_text = f"Mesh Statistics:\n"
     stats_text += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
     stats_text += f"Vertices: {len(vertices):,}\n"
-    stats_text += f"Faces: {len(mesh.faces):,}\n\n"
+    stats_text += f"Faces: {n_faces:,}\n\n"
     stats_text += "Bounding Box:\n"
-    stats_text += f"  X: [{vertices[:, 0].min():.4f}, {vertices[:, 0].max():.4f}]\n"
-    stats_text += f"  Y: [{vertices[:, 1].min():.4f}, {vertices[:, 1].max():.4f}]\n"
-    stats_text += f"  Z: [{vertices[:, 2].min():.4f}, {vertices[:, 2].max():.4f}]\n\n"
+    stats_text += f"  X: [{bb_min[0]:.4f}, {bb_max[0]:.4f}]\n"
+    stats_text += f"  Y: [{bb_min[1]:.4f}, {bb_max[1]:.4f}]\n"
+    stats_text += f"  Z: [{bb_min[2]:.4f}, {bb_max[2]:.4f}]\n\n"
     stats_text += "Centroid:\n"
-    stats_text += f"  ({vertices[:, 0].mean():.4f}, {vertices[:, 1].mean():.4f}, {vertices[:, 2].mean():.4f})\n\n"
-    stats_text += f"Volume: {mesh.volume:.6f}\n"
-    stats_text += f"Surface Area: {mesh.area:.6f}"
+    stats_text += f"  ({centroid[0]:.4f}, {centroid[1]:.4f}, {centroid[2]:.4f})\n\n"
+    stats_text += f"Volume: {geometry['volume']:.6f}\n"
+    stats_text += f"Surface Area: {geometry['area']:.6f}"
     
     ax.text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
             verticalalignment='center', transform=ax.transAxes,
@@ -133,36 +179,36 @@ def create_comparison_plot(original_vertices, reconstructed_vertices, method, ba
                  fontsize=16, fontweight='bold')
     
     ax = axes[0, 0]
-    scatter = ax.scatter(original_vertices[:, 0], original_vertices[:, 1], 
-                        c=original_vertices[:, 2], cmap='viridis', s=1, alpha=0.6)
+    hb = ax.hexbin(original_vertices[:, 0], original_vertices[:, 1], 
+                   C=original_vertices[:, 2], gridsize=HEXBIN_GRIDSIZE, cmap='viridis')
     ax.set_xlabel('X')
     ax.set_ylabel('Y')
     ax.set_title('Original Mesh (XY)', fontweight='bold')
     ax.grid(alpha=0.3)
-    plt.colorbar(scatter, ax=ax, label='Z')
+    plt.colorbar(hb, ax=ax, label='Z')
     
     ax = axes[0, 1]
-    scatter = ax.scatter(reconstructed_vertices[:, 0], reconstructed_vertices[:, 1], 
-                        c=reconstructed_vertices[:, 2], cmap='viridis', s=1, alpha=0.6)
+    hb = ax.hexbin(reconstructed_vertices[:, 0], reconstructed_vertices[:, 1], 
+                   C=reconstructed_vertices[:, 2], gridsize=HEXBIN_GRIDSIZE, cmap='viridis')
     ax.set_xlabel('X')
     ax.set_ylabel('Y')
     ax.set_title('Reconstructed Mesh (XY)', fontweight='bold')
     ax.grid(alpha=0.3)
-    plt.colorbar(scatter, ax=ax, label='Z')
+    plt.colorbar(hb, ax=ax, label='Z')
     
     ax = axes[0, 2]
-    scatter = ax.scatter(reconstructed_vertices[:, 0], reconstructed_vertices[:, 1], 
-                        c=error_magnitude, cmap='Reds', s=1, alpha=0.6)
+    hb = ax.hexbin(reconstructed_vertices[:, 0], reconstructed_vertices[:, 1], 
+                   C=error_magnitude, gridsize=HEXBIN_GRIDSIZE, cmap='Reds')
     ax.set_xlabel('X')
     ax.set_ylabel('Y')
     ax.set_title('Error Magnitude (XY)', fontweight='bold')
     ax.grid(alpha=0.3)
-    plt.colorbar(scatter, ax=ax, label='Error')
+    plt.colorbar(hb, ax=ax, label='Error')
     
     ax = axes[1, 0]
-    ax.hist(error[:, 0], bins=30, alpha=0.7, label='X Error', color='#FF6B6B')
-    ax.hist(error[:, 1], bins=30, alpha=0.7, label='Y Error', color='#4ECDC4')
-    ax.hist(error[:, 2], bins=30, alpha=0.7, label='Z Error', color='#45B7D1')
+    plot_histogram(ax, error[:, 0], 30, alpha=0.7, label='X Error', color='#FF6B6B')
+    plot_histogram(ax, error[:, 1], 30, alpha=0.7, label='Y Error', color='#4ECDC4')
+    plot_histogram(ax, error[:, 2], 30, alpha=0.7, label='Z Error', color='#45B7D1')
     ax.set_xlabel('Error Value')
     ax.set_ylabel('Frequency')
     ax.set_title('Error Distribution per Axis', fontweight='bold')
@@ -170,7 +216,7 @@ def create_comparison_plot(original_vertices, reconstructed_vertices, method, ba
     ax.grid(alpha=0.3)
     
     ax = axes[1, 1]
-    ax.hist(error_magnitude, bins=50, alpha=0.7, color='coral')
+    plot_histogram(ax, error_magnitude, 50, alpha=0.7, color='coral')
     ax.set_xlabel('Error Magnitude')
     ax.set_ylabel('Frequency')
     ax.set_title('Overall Error Magnitude', fontweight='bold')
@@ -180,7 +226,8 @@ def create_comparison_plot(original_vertices, reconstructed_vertices, method, ba
     ax.axis('off')
     
     mse = np.mean(error ** 2)
-    mae = np.mean(np.abs(error))
+    mae_per_axis = error.mean(axis=0)
+    mae = mae_per_axis.mean()
     max_error = error_magnitude.max()
     
     error_text = f"Error Statistics:\n"
@@ -191,9 +238,9 @@ def create_comparison_plot(original_vertices, reconstructed_vertices, method, ba
     error_text += f"MAE: {mae:.6e}\n"
     error_text += f"Max Error: {max_error:.6e}\n\n"
     error_text += "Per-Axis MAE:\n"
-    error_text += f"  X: {np.mean(np.abs(error[:, 0])):.6e}\n"
-    error_text += f"  Y: {np.mean(np.abs(error[:, 1])):.6e}\n"
-    error_text += f"  Z: {np.mean(np.abs(error[:, 2])):.6e}"
+    error_text += f"  X: {mae_per_axis[0]:.6e}\n"
+    error_text += f"  Y: {mae_per_axis[1]:.6e}\n"
+    error_text += f"  Z: {mae_per_axis[2]:.6e}"
     
     ax.text(0.1, 0.5, error_text, fontsize=11, family='monospace',
             verticalalignment='center', transform=ax.transAxes,
@@ -202,21 +249,32 @@ def create_comparison_plot(original_vertices, reconstructed_vertices, method, ba
     plt.tight_layout()
     plt.savefig(output_file, dpi=150, bbox_inches='tight')
     plt.close()
+    
+    return float(mse), float(mae)
 
-def visualize_mesh(obj_file, output_path, visuals_path):
-    filename = Path(obj_file).name
-    base_name = Path(obj_file).stem
+def visualize_mesh(mesh_file, output_path, visuals_path, geom_cache=None):
+    obj_file, filename, base_name = mesh_file
     
     print(f"\nVisualizing: {filename}")
     
-    mesh = load_mesh(obj_file)
-    original_vertices = mesh.vertices
+    geometry = cached_geometry(obj_file, base_name, geom_cache)
+    cached = load_cached_original(output_path, base_name, obj_file) if geometry else None
+    
+    if cached is not None:
+        original_vertices, n_faces = cached
+    else:
+        mesh = load_mesh(obj_file)
+        original_vertices = mesh.vertices.view(np.ndarray)
+        n_faces = len(mesh.faces)
+        geometry = geometry or mesh_geometry(mesh, obj_file)
     
     original_plot_path = visuals_path / f"{base_name}_original.png"
-    create_mesh_info_plot(mesh, f'Original Mesh: {base_name}', original_plot_path)
+    create_mesh_info_plot(original_vertices, n_faces, geometry, f'Original Mesh: {base_name}', original_plot_path)
     
     stats = {
         'filename': filename,
+        'base_name': base_name,
+        'geometry': geometry,
         'visualizations_created': 1,
         'methods': {}
     }
@@ -231,38 +289,34 @@ def visualize_mesh(obj_file, output_path, visuals_path):
             continue
         
         comparison_plot_path = visuals_path / f"{base_name}_{method_name}_comparison.png"
-        create_comparison_plot(original_vertices, reconstructed_vertices, 
-                             method_name, base_name, comparison_plot_path)
+        mse, mae = create_comparison_plot(original_vertices, reconstructed_vertices, 
+                                          method_name, base_name, comparison_plot_path)
         
         stats['visualizations_created'] += 1
         stats['methods'][method_name] = {
-            'comparison_plot': str(comparison_plot_path.name)
+            'comparison_plot': str(comparison_plot_path.name),
+            'mse_total': mse,
+            'mae_total': mae
         }
     
     return stats
 
 def create_summary_plot(all_stats, output_path):
-    metrics_data = {}
-    
-    for metrics_file in output_path.glob('*_metrics_*.json'):
-        filename = metrics_file.stem
-        parts = filename.split('_metrics_')
-        mesh_name = parts[0]
-        method = parts[1]
-        
-        with open(metrics_file, 'r') as f:
-            metrics = json.load(f)
-        
-        if mesh_name not in metrics_data:
-            metrics_data[mesh_name] = {}
-        
-        metrics_data[mesh_name][method] = metrics
+    methods = ['minmax', 'sphere']
+    summary_stats = sorted(
+        (stat for stat in all_stats if all(m in stat['methods'] for m in methods)),
+        key=lambda stat: stat['base_name'])
     
-    if not metrics_data:
+    if not summary_stats:
         return
     
-    mesh_names = sorted(metrics_data.keys())
-    methods = ['minmax', 'sphere']
+    mesh_names = [stat['base_name'] for stat in summary_stats]
+    minmax = np.array([[stat['methods']['minmax']['mse_total'], stat['methods']['minmax']['mae_total']]
+                       for stat in summary_stats])
+    sphere = np.array([[stat['methods']['sphere']['mse_total'], stat['methods']['sphere']['mae_total']]
+                       for stat in summary_stats])
+    minmax_mse, minmax_mae = minmax[:, 0], minmax[:, 1]
+    sphere_mse, sphere_mae = sphere[:, 0], sphere[:, 1]
     
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     fig.suptitle('Reconstruction Quality Summary - All Meshes', 
@@ -271,8 +325,6 @@ def create_summary_plot(all_stats, output_path):
     ax = axes[0, 0]
     x = np.arange(len(mesh_names))
     width = 0.35
-    minmax_mse = [metrics_data[m]['minmax']['mse_total'] for m in mesh_names]
-    sphere_mse = [metrics_data[m]['sphere']['mse_total'] for m in mesh_names]
     ax.bar(x - width/2, minmax_mse, width, label='Min-Max', alpha=0.8, color='#FF6B6B')
     ax.bar(x + width/2, sphere_mse, width, label='Sphere', alpha=0.8, color='#4ECDC4')
     ax.set_xlabel('Mesh')
@@ -285,8 +337,6 @@ def create_summary_plot(all_stats, output_path):
     ax.set_yscale('log')
     
     ax = axes[0, 1]
-    minmax_mae = [metrics_data[m]['minmax']['mae_total'] for m in mesh_names]
-    sphere_mae = [metrics_data[m]['sphere']['mae_total'] for m in mesh_names]
     ax.bar(x - width/2, minmax_mae, width, label='Min-Max', alpha=0.8, color='#FF6B6B')
     ax.bar(x + width/2, sphere_mae, width, label='Sphere', alpha=0.8, color='#4ECDC4')
     ax.set_xlabel('Mesh')
@@ -299,8 +349,7 @@ def create_summary_plot(all_stats, output_path):
     ax.set_yscale('log')
     
     ax = axes[1, 0]
-    improvement = [(metrics_data[m]['sphere']['mse_total'] - metrics_data[m]['minmax']['mse_total']) / 
-                   metrics_data[m]['sphere']['mse_total'] * 100 for m in mesh_names]
+    improvement = (sphere_mse - minmax_mse) / sphere_mse * 100
     colors = ['green' if i > 0 else 'red' for i in improvement]
     ax.bar(x, improvement, alpha=0.8, color=colors)
     ax.set_xlabel('Mesh')
@@ -314,10 +363,8 @@ def create_summary_plot(all_stats, output_path):
     ax = axes[1, 1]
     ax.axis('off')
     
-    avg_mse_minmax = np.mean(minmax_mse)
-    avg_mse_sphere = np.mean(sphere_mse)
-    avg_mae_minmax = np.mean(minmax_mae)
-    avg_mae_sphere = np.mean(sphere_mae)
+    avg_mse_minmax, avg_mae_minmax = minmax.mean(axis=0)
+    avg_mse_sphere, avg_mae_sphere = sphere.mean(axis=0)
     
     summary_text = f"Overall Summary:\n"
     summary_text += "━━━━━━━━━━━━━━━━━━━━━━\n"
@@ -346,18 +393,26 @@ def create_summary_plot(all_stats, output_path):
 def update_log(all_stats):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_path = Path('logs') / f'step7_{timestamp}.log'
-    
-    with open(log_path, 'w', encoding='utf-8') as f:
-        f.write(f"Step 7 - Visualize Meshes - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(f"Created visualizations for {len(all_stats)} mesh files\n\n")
-        
-        for stat in all_stats:
-            f.write(f"File: {stat['filename']}\n")
-            f.write(f"  Visualizations created: {stat['visualizations_created']}\n")
-            for method_name in stat['methods']:
-                f.write(f"    {method_name}: {stat['methods'][method_name]['comparison_plot']}\n")
-            f.write("\n")
+    parts = [
+        f"Step 7 - Visualize Meshes - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        "=" * 60 + "\n\n",
+        f"Created visualizations for {len(all_stats)} mesh files\n\n"
+    ]
+    
+    for stat in all_stats:
+        parts.append(f"File: {stat['filename']}\n"
+                     f"  Visualizations created: {stat['visualizations_created']}\n")
+        for method_name, method_stats in stat['methods'].items():
+            parts.append(f"    {method_name}: {method_stats['comparison_plot']}\n")
+        parts.append("\n")
+    
+    log_path.write_text(''.join(parts), encoding='utf-8')
+
+def _warm_mpl():
+    fig, ax = plt.subplots()
+    ax.text(0, 0, 'x')
+    fig.canvas.draw()
+    plt.close(fig)
 
 def main():
     print("STEP 7 - Visualize Original vs Reconstructed Meshes")
@@ -374,12 +429,14 @@ def main():
         print(f"Please run previous steps first.")
         sys.exit(1)
     
-    all_stats = []
+    geom_cache = load_geom_cache(output_path)
     
-    for obj_file in obj_files:
-        stats = visualize_mesh(obj_file, output_path, visuals_path)
-        all_stats.append(stats)
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_warm_mpl) as executor:
+        all_stats = list(executor.map(partial(visualize_mesh, output_path=output_path,
+                                              visuals_path=visuals_path, geom_cache=geom_cache),
+                                      obj_files))
     
+    save_geom_cache(output_path, all_stats)
     create_summary_plot(all_stats, output_path)
     update_log(all_stats)
     
@@ -1,290 +1,405 @@
 import os
 import sys
-import json
+import stat
+import mmap
 import numpy as np
 from pathlib import Path
 from datetime import datetime
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from jsonio import parse_json
 
-def load_all_metrics(output_path):
-    metrics_data = {}
-    metrics_files = list(output_path.glob('*_metrics_*.json'))
+MMAP_THRESHOLD = 4096
+
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+_U80 = "─" * 80
+_DASH40 = "-" * 40
+
+_EQ80_NL = _EQ80 + "\n"
+_DASH80_NL = _DASH80 + "\n"
+_DASH40_NL = _DASH40 + "\n"
+
+_REPORT_TITLE = "3D MESH NORMALIZATION AND QUANTIZATION - FINAL REPORT"
+_MANIFEST_TITLE = "FILE MANIFEST - 3D Mesh Normalization Project"
+
+_SUMMARY = (
+    "Project: Bandook - 3D Mesh Processing Pipeline\n"
+    + _EQ80_NL + "\n"
+    "EXECUTIVE SUMMARY\n"
+    + _DASH80_NL + "\n"
+    "This report presents the results of a comprehensive 3D mesh normalization and\n"
+    "quantization study. Eight mesh models were processed using two normalization\n"
+    "methods (Min-Max and Unit Sphere), quantized to 1024 discrete bins, and\n"
+    "reconstructed to evaluate quality.\n\n"
+    "KEY FINDINGS:\n"
+    "• Min-Max normalization consistently outperforms Unit Sphere normalization\n"
+    "• All reconstructions achieve excellent quality (MSE < 0.001 threshold)\n"
+    "• 1024 quantization bins provide sufficient precision\n"
+    "• Reconstruction errors are uniformly distributed (no systematic bias)\n"
+    "• Best performance: explosive.obj (MSE: 1.24e-07 with Min-Max)\n\n"
+)
+
+_METHODOLOGY = (
+    _EQ80_NL +
+    "METHODOLOGY\n"
+    + _EQ80_NL + "\n"
+    "Normalization Methods:\n"
+    + _DASH40_NL +
+    "1. MIN-MAX NORMALIZATION\n"
+    "   • Range: [0, 1] per axis independently\n"
+    "   • Formula: normalized = (vertices - v_min) / (v_max - v_min)\n"
+    "   • Inverse: vertices = normalized * (v_max - v_min) + v_min\n\n"
+    "2. UNIT SPHERE NORMALIZATION\n"
+    "   • Range: Within unit sphere (radius ≤ 1) centered at origin\n"
+    "   • Formula: normalized = (vertices - center) / scale\n"
+    "   • Inverse: vertices = normalized * scale + center\n\n"
+    "Quantization:\n"
+    + _DASH40_NL +
+    "• BINS: 1024 (range 0-1023)\n"
+    "• Process: Normalized coordinates → integer bins → dequantized\n"
+    "• Mapping: q = floor(normalized * 1023) for [0,1] range\n"
+    "• Sphere method: Map [-1,1] to [0,1] before quantizing\n\n"
+    + _EQ80_NL +
+    "DETAILED RESULTS BY MESH\n"
+    + _EQ80_NL + "\n"
+)
+
+_CONCLUSIONS = (
+    _EQ80_NL +
+    "CONCLUSIONS\n"
+    + _EQ80_NL + "\n"
+    "1. NORMALIZATION METHOD PERFORMANCE\n"
+    "   Min-Max normalization is superior for this dataset because:\n"
+    "   • Uses full quantization range per axis (better precision)\n"
+    "   • Preserves axis-independent scaling\n"
+    "   • Well-suited for axis-aligned meshes\n"
+    "   • 2-3× lower error compared to Unit Sphere method\n\n"
+    "2. QUANTIZATION QUALITY\n"
+    "   1024 bins provides excellent reconstruction quality:\n"
+    "   • All MSE values well below threshold (0.001)\n"
+    "   • Sub-millimeter reconstruction errors\n"
+    "   • No visible distortions in visualizations\n"
+    "   • Uniform error distribution (no systematic bias)\n\n"
+    "3. PRACTICAL RECOMMENDATIONS\n"
+    "   • Use Min-Max for general-purpose mesh quantization\n"
+    "   • Use Unit Sphere for spherical/centered objects\n"
+    "   • 1024 bins is optimal for most applications\n"
+    "   • Higher bins (2048, 4096) for critical applications\n\n"
+    "4. IMPLEMENTATION QUALITY\n"
+    "   The pipeline demonstrates:\n"
+    "   • Exact mathematical correctness (perfect denormalization)\n"
+    "   • Robust error handling and validation\n"
+    "   • Comprehensive metrics and visualization\n"
+    "   • Deterministic and reproducible results\n\n"
+)
+
+_FOOTER = (
+    _EQ80_NL +
+    "END OF REPORT\n"
+    + _EQ80_NL +
+    "\nFor detailed visualizations, see: outputs/visuals/\n"
+    "For raw metrics data, see: outputs/*_metrics_*.json\n"
+    "For source code, see: src/\n"
+)
+
+_TS_FMT = "Generated: %s\n"
+
+_BANNER_FMT = _EQ80_NL + "%s\n" + _EQ80_NL + _TS_FMT
+
+_MESH_HEAD_FMT = "\n" + _U80 + "\nMESH: %s.obj\n" + _U80 + "\n\n"
+
+MESH_STATS_TMPL = (
+    "Mesh Statistics:\n"
+    "  Vertices: %s\n"
+    "  Bounding Box:\n"
+    "    X: [%.6f, %.6f]\n"
+    "    Y: [%.6f, %.6f]\n"
+    "    Z: [%.6f, %.6f]\n\n"
+)
+
+MESH_METHOD_TMPL = (
+    "Method: %s\n"
+    + _DASH40_NL +
+    "  Overall Error Metrics:\n"
+    "    MSE (total):     %.10f\n"
+    "    MAE (total):     %.10f\n"
+    "    Max error:       %.10f\n"
+    "    Min error:       %.10f\n"
+    "    Std error:       %.10f\n\n"
+    "  Per-Axis MSE:\n"
+    "    X-axis:          %.10f\n"
+    "    Y-axis:          %.10f\n"
+    "    Z-axis:          %.10f\n\n"
+    "  Per-Axis MAE:\n"
+    "    X-axis:          %.10f\n"
+    "    Y-axis:          %.10f\n"
+    "    Z-axis:          %.10f\n\n"
+)
+
+TMPL_MM = (
+    "Method Comparison:\n"
+    + _DASH40_NL +
+    "  ✓ Min-Max performs better (%.2f× lower MSE)\n"
+    "    Reason: Better utilization of quantization bins for\n"
+    "            axis-aligned geometry\n"
+    "\n"
+)
+
+TMPL_SP = (
+    "Method Comparison:\n"
+    + _DASH40_NL +
+    "  ✓ Unit Sphere performs better (%.2f× lower MSE)\n"
+    "    Reason: More spherically-shaped mesh benefits from\n"
+    "            uniform radial scaling\n"
+    "\n"
+)
+
+def _read_bytes(path):
+    with open(path, 'rb', buffering=0) as f:
+        return f.readall()
+
+def _load_json_file(path, size):
+    if size < MMAP_THRESHOLD:
+        return parse_json(_read_bytes(path))
     
-    for metrics_file in metrics_files:
-        filename = metrics_file.stem
-        parts = filename.split('_metrics_')
-        mesh_name = parts[0]
-        method = parts[1]
-        
-        with open(metrics_file, 'r') as f:
-            metrics = json.load(f)
-        
-        if mesh_name not in metrics_data:
-            metrics_data[mesh_name] = {}
-        
-        metrics_data[mesh_name][method] = metrics
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return parse_json(f.read())
     
-    return metrics_data
+    with mm, memoryview(mm) as view:
+        return parse_json(view)
+
+def is_up_to_date(target, inputs_mtime):
+    try:
+        return inputs_mtime <= os.stat(target).st_mtime_ns
+    except OSError:
+        return False
 
-def load_mesh_stats(output_path):
+def find_outputs(output_path):
+    stats_files = []
+    metrics_files = []
+    
+    with os.scandir(output_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith('.json') or not entry.is_file():
+                continue
+            
+            if name.endswith('_stats.json'):
+                stats_files.append((name[:-len('_stats.json')], entry.path, entry.stat()))
+            elif '_metrics_' in name:
+                mesh_name, _, method = name[:-len('.json')].partition('_metrics_')
+                metrics_files.append((mesh_name, method, entry.path, entry.stat()))
+    
+    return stats_files, metrics_files
+
+def scan_outputs(stats_files, metrics_files):
+    files = [(path, st.st_size) for *_, path, st in stats_files + metrics_files]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        loaded = list(executor.map(_load_json_file, *zip(*files))) if files else []
+    
     stats_data = {}
-    stats_files = list(output_path.glob('*_stats.json'))
+    for (mesh_name, _, _), data in zip(stats_files, loaded):
+        stats_data[mesh_name] = data
     
-    for stats_file in stats_files:
-        mesh_name = stats_file.stem.replace('_stats', '')
-        
-        with open(stats_file, 'r') as f:
-            stats = json.load(f)
-        
-        stats_data[mesh_name] = stats
+    metrics_data = {}
+    for (mesh_name, method, _, _), data in zip(metrics_files, loaded[len(stats_files):]):
+        metrics_data.setdefault(mesh_name, {})[method] = data
     
-    return stats_data
+    return metrics_data, stats_data
 
-def create_report_text(output_path):
-    report_file = output_path / 'REPORT.txt'
-    metrics_data = load_all_metrics(output_path)
-    stats_data = load_mesh_stats(output_path)
-    
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write("=" * 80 + "\n")
-        f.write("3D MESH NORMALIZATION AND QUANTIZATION - FINAL REPORT\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Project: Bandook - 3D Mesh Processing Pipeline\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write("EXECUTIVE SUMMARY\n")
-        f.write("-" * 80 + "\n\n")
-        f.write("This report presents the results of a comprehensive 3D mesh normalization and\n")
-        f.write("quantization study. Eight mesh models were processed using two normalization\n")
-        f.write("methods (Min-Max and Unit Sphere), quantized to 1024 discrete bins, and\n")
-        f.write("reconstructed to evaluate quality.\n\n")
-        
-        f.write("KEY FINDINGS:\n")
-        f.write("• Min-Max normalization consistently outperforms Unit Sphere normalization\n")
-        f.write("• All reconstructions achieve excellent quality (MSE < 0.001 threshold)\n")
-        f.write("• 1024 quantization bins provide sufficient precision\n")
-        f.write("• Reconstruction errors are uniformly distributed (no systematic bias)\n")
-        f.write("• Best performance: explosive.obj (MSE: 1.24e-07 with Min-Max)\n\n")
-        
-        f.write("=" * 80 + "\n")
-        f.write("METHODOLOGY\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write("Normalization Methods:\n")
-        f.write("-" * 40 + "\n")
-        f.write("1. MIN-MAX NORMALIZATION\n")
-        f.write("   • Range: [0, 1] per axis independently\n")
-        f.write("   • Formula: normalized = (vertices - v_min) / (v_max - v_min)\n")
-        f.write("   • Inverse: vertices = normalized * (v_max - v_min) + v_min\n\n")
-        
-        f.write("2. UNIT SPHERE NORMALIZATION\n")
-        f.write("   • Range: Within unit sphere (radius ≤ 1) centered at origin\n")
-        f.write("   • Formula: normalized = (vertices - center) / scale\n")
-        f.write("   • Inverse: vertices = normalized * scale + center\n\n")
-        
-        f.write("Quantization:\n")
-        f.write("-" * 40 + "\n")
-        f.write("• BINS: 1024 (range 0-1023)\n")
-        f.write("• Process: Normalized coordinates → integer bins → dequantized\n")
-        f.write("• Mapping: q = floor(normalized * 1023) for [0,1] range\n")
-        f.write("• Sphere method: Map [-1,1] to [0,1] before quantizing\n\n")
-        
-        f.write("=" * 80 + "\n")
-        f.write("DETAILED RESULTS BY MESH\n")
-        f.write("=" * 80 + "\n\n")
-        
-        sorted_meshes = sorted(metrics_data.keys())
-        
-        for mesh_name in sorted_meshes:
-            f.write(f"\n{'─' * 80}\n")
-            f.write(f"MESH: {mesh_name}.obj\n")
-            f.write(f"{'─' * 80}\n\n")
-            
-            if mesh_name in stats_data:
-                stats = stats_data[mesh_name]['statistics']
-                f.write(f"Mesh Statistics:\n")
-                f.write(f"  Vertices: {stats['n_vertices']:,}\n")
-                f.write(f"  Bounding Box:\n")
-                f.write(f"    X: [{stats['min']['x']:.6f}, {stats['max']['x']:.6f}]\n")
-                f.write(f"    Y: [{stats['min']['y']:.6f}, {stats['max']['y']:.6f}]\n")
-                f.write(f"    Z: [{stats['min']['z']:.6f}, {stats['max']['z']:.6f}]\n\n")
-            
-            mesh_metrics = metrics_data[mesh_name]
-            
-            for method in ['minmax', 'sphere']:
-                if method not in mesh_metrics:
-                    continue
-                
-                metrics = mesh_metrics[method]
-                method_name = "MIN-MAX" if method == 'minmax' else "UNIT SPHERE"
-                
-                f.write(f"Method: {method_name}\n")
-                f.write(f"{'-' * 40}\n")
-                f.write(f"  Overall Error Metrics:\n")
-                f.write(f"    MSE (total):     {metrics['mse_total']:.10f}\n")
-                f.write(f"    MAE (total):     {metrics['mae_total']:.10f}\n")
-                f.write(f"    Max error:       {metrics['max_error']:.10f}\n")
-                f.write(f"    Min error:       {metrics['min_error']:.10f}\n")
-                f.write(f"    Std error:       {metrics['std_error']:.10f}\n\n")
-                
-                f.write(f"  Per-Axis MSE:\n")
-                f.write(f"    X-axis:          {metrics['mse_per_axis']['x']:.10f}\n")
-                f.write(f"    Y-axis:          {metrics['mse_per_axis']['y']:.10f}\n")
-                f.write(f"    Z-axis:          {metrics['mse_per_axis']['z']:.10f}\n\n")
-                
-                f.write(f"  Per-Axis MAE:\n")
-                f.write(f"    X-axis:          {metrics['mae_per_axis']['x']:.10f}\n")
-                f.write(f"    Y-axis:          {metrics['mae_per_axis']['y']:.10f}\n")
-                f.write(f"    Z-axis:          {metrics['mae_per_axis']['z']:.10f}\n\n")
+def banner(title, ts_pretty):
+    return _BANNER_FMT % (title, ts_pretty)
+
+def write_parts(path, parts):
+    with open(path, 'wb') as f:
+        f.write(''.join(parts).encode('utf-8'))
+
+def report_is_current(report_file, stats_files, metrics_files):
+    inputs_mtime = max([st.st_mtime_ns for *_, st in stats_files + metrics_files]
+                       + [os.stat(__file__).st_mtime_ns])
+    return is_up_to_date(report_file, inputs_mtime)
+
+def restamp_report(report_file, mesh_names, ts_pretty):
+    text = _read_bytes(report_file).decode('utf-8')
+    listed = [line[len('MESH: '):-len('.obj')] for line in text.splitlines() if line.startswith('MESH: ')]
+    if listed != mesh_names:
+        return False
+    
+    head, sep, rest = text.partition(_TS_FMT.split('%')[0])
+    if not sep:
+        return False
+    
+    write_parts(report_file, (head, _TS_FMT % ts_pretty, rest.partition('\n')[2]))
+    return True
+
+def write_report(report_file, data, ts_pretty):
+    metrics_data, stats_data = data
+    
+    out = []
+    out.append(banner(_REPORT_TITLE, ts_pretty))
+    out.append(_SUMMARY)
+    out.append(_METHODOLOGY)
+    
+    sorted_meshes = sorted(metrics_data.keys())
+    mm_list = [metrics_data[m].get('minmax') for m in sorted_meshes]
+    sp_list = [metrics_data[m].get('sphere') for m in sorted_meshes]
+    
+    for mesh_name, mm, sp in zip(sorted_meshes, mm_list, sp_list):
+        out.append(_MESH_HEAD_FMT % mesh_name)
+        
+        if mesh_name in stats_data:
+            stats = stats_data[mesh_name]['statistics']
+            v_min, v_max = stats['min'], stats['max']
+            out.append(MESH_STATS_TMPL % (
+                format(stats['n_vertices'], ','),
+                v_min['x'], v_max['x'],
+                v_min['y'], v_max['y'],
+                v_min['z'], v_max['z']))
+        
+        for method_name, metrics in (("MIN-MAX", mm), ("UNIT SPHERE", sp)):
+            if metrics is None:
+                continue
             
-            if 'minmax' in mesh_metrics and 'sphere' in mesh_metrics:
-                mse_mm = mesh_metrics['minmax']['mse_total']
-                mse_sp = mesh_metrics['sphere']['mse_total']
-                ratio = mse_sp / mse_mm if mse_mm > 0 else 0
-                
-                f.write(f"Method Comparison:\n")
-                f.write(f"{'-' * 40}\n")
-                if mse_mm < mse_sp:
-                    f.write(f"  ✓ Min-Max performs better ({ratio:.2f}× lower MSE)\n")
-                    f.write(f"    Reason: Better utilization of quantization bins for\n")
-                    f.write(f"            axis-aligned geometry\n")
-                else:
-                    f.write(f"  ✓ Unit Sphere performs better ({1/ratio:.2f}× lower MSE)\n")
-                    f.write(f"    Reason: More spherically-shaped mesh benefits from\n")
-                    f.write(f"            uniform radial scaling\n")
-                f.write("\n")
-        
-        f.write("\n" + "=" * 80 + "\n")
-        f.write("COMPARATIVE ANALYSIS\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write("Performance Ranking (by MSE - Min-Max Method):\n")
-        f.write("-" * 80 + "\n")
-        
-        mesh_mse = [(mesh, metrics_data[mesh]['minmax']['mse_total']) 
-                    for mesh in sorted_meshes if 'minmax' in metrics_data[mesh]]
-        mesh_mse.sort(key=lambda x: x[1])
-        
-        for rank, (mesh, mse) in enumerate(mesh_mse, 1):
-            f.write(f"  {rank}. {mesh:<15} MSE: {mse:.10f}\n")
-        
-        f.write("\n")
-        
-        f.write("Average Metrics Across All Meshes:\n")
-        f.write("-" * 80 + "\n")
-        
-        avg_mse_mm = np.mean([metrics_data[m]['minmax']['mse_total'] 
-                              for m in sorted_meshes if 'minmax' in metrics_data[m]])
-        avg_mse_sp = np.mean([metrics_data[m]['sphere']['mse_total'] 
-                              for m in sorted_meshes if 'sphere' in metrics_data[m]])
-        avg_mae_mm = np.mean([metrics_data[m]['minmax']['mae_total'] 
-                              for m in sorted_meshes if 'minmax' in metrics_data[m]])
-        avg_mae_sp = np.mean([metrics_data[m]['sphere']['mae_total'] 
-                              for m in sorted_meshes if 'sphere' in metrics_data[m]])
-        
-        f.write(f"  Min-Max Normalization:\n")
-        f.write(f"    Average MSE:     {avg_mse_mm:.10f}\n")
-        f.write(f"    Average MAE:     {avg_mae_mm:.10f}\n\n")
-        
-        f.write(f"  Unit Sphere Normalization:\n")
-        f.write(f"    Average MSE:     {avg_mse_sp:.10f}\n")
-        f.write(f"    Average MAE:     {avg_mae_sp:.10f}\n\n")
-        
-        improvement = ((avg_mse_sp - avg_mse_mm) / avg_mse_sp) * 100
-        f.write(f"  → Min-Max shows {improvement:.1f}% improvement over Unit Sphere\n\n")
-        
-        f.write("=" * 80 + "\n")
-        f.write("CONCLUSIONS\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write("1. NORMALIZATION METHOD PERFORMANCE\n")
-        f.write("   Min-Max normalization is superior for this dataset because:\n")
-        f.write("   • Uses full quantization range per axis (better precision)\n")
-        f.write("   • Preserves axis-independent scaling\n")
-        f.write("   • Well-suited for axis-aligned meshes\n")
-        f.write("   • 2-3× lower error compared to Unit Sphere method\n\n")
-        
-        f.write("2. QUANTIZATION QUALITY\n")
-        f.write("   1024 bins provides excellent reconstruction quality:\n")
-        f.write("   • All MSE values well below threshold (0.001)\n")
-        f.write("   • Sub-millimeter reconstruction errors\n")
-        f.write("   • No visible distortions in visualizations\n")
-        f.write("   • Uniform error distribution (no systematic bias)\n\n")
-        
-        f.write("3. PRACTICAL RECOMMENDATIONS\n")
-        f.write("   • Use Min-Max for general-purpose mesh quantization\n")
-        f.write("   • Use Unit Sphere for spherical/centered objects\n")
-        f.write("   • 1024 bins is optimal for most applications\n")
-        f.write("   • Higher bins (2048, 4096) for critical applications\n\n")
-        
-        f.write("4. IMPLEMENTATION QUALITY\n")
-        f.write("   The pipeline demonstrates:\n")
-        f.write("   • Exact mathematical correctness (perfect denormalization)\n")
-        f.write("   • Robust error handling and validation\n")
-        f.write("   • Comprehensive metrics and visualization\n")
-        f.write("   • Deterministic and reproducible results\n\n")
-        
-        f.write("=" * 80 + "\n")
-        f.write("END OF REPORT\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"\nFor detailed visualizations, see: outputs/visuals/\n")
-        f.write(f"For raw metrics data, see: outputs/*_metrics_*.json\n")
-        f.write(f"For source code, see: src/\n")
+            mse_axis, mae_axis = metrics['mse_per_axis'], metrics['mae_per_axis']
+            out.append(MESH_METHOD_TMPL % (
+                method_name,
+                metrics['mse_total'], metrics['mae_total'],
+                metrics['max_error'], metrics['min_error'], metrics['std_error'],
+                mse_axis['x'], mse_axis['y'], mse_axis['z'],
+                mae_axis['x'], mae_axis['y'], mae_axis['z']))
+        
+        if mm is not None and sp is not None:
+            mse_mm = mm['mse_total']
+            mse_sp = sp['mse_total']
+            ratio = mse_sp / mse_mm if mse_mm > 0 else 0
+            out.append(TMPL_MM % ratio if mse_mm < mse_sp else TMPL_SP % (1 / ratio))
+    
+    out.append("\n" + _EQ80_NL)
+    out.append("COMPARATIVE ANALYSIS\n")
+    out.append(_EQ80_NL + "\n")
+    
+    rows = []
+    for mm, sp in zip(mm_list, sp_list):
+        rows.append((mm['mse_total'] if mm is not None else np.nan,
+                     mm['mae_total'] if mm is not None else np.nan,
+                     sp['mse_total'] if sp is not None else np.nan,
+                     sp['mae_total'] if sp is not None else np.nan))
+    totals = np.array(rows, dtype=np.float64).reshape(-1, 4)
+    
+    out.append("Performance Ranking (by MSE - Min-Max Method):\n")
+    out.append(_DASH80_NL)
+    
+    mse_mm = totals[:, 0]
+    ranked = np.flatnonzero(~np.isnan(mse_mm))
+    ranked = ranked[np.argsort(mse_mm[ranked], kind='stable')]
+    
+    for rank, (mesh, mse) in enumerate(zip(np.array(sorted_meshes)[ranked], mse_mm[ranked]), 1):
+        out.append(f"  {rank}. {mesh:<15} MSE: {mse:.10f}\n")
+    
+    out.append("\n")
+    
+    out.append("Average Metrics Across All Meshes:\n")
+    out.append(_DASH80_NL)
+    
+    avg_mse_mm, avg_mae_mm, avg_mse_sp, avg_mae_sp = np.nanmean(totals, axis=0)
+    
+    out.append(f"  Min-Max Normalization:\n")
+    out.append(f"    Average MSE:     {avg_mse_mm:.10f}\n")
+    out.append(f"    Average MAE:     {avg_mae_mm:.10f}\n\n")
+    
+    out.append(f"  Unit Sphere Normalization:\n")
+    out.append(f"    Average MSE:     {avg_mse_sp:.10f}\n")
+    out.append(f"    Average MAE:     {avg_mae_sp:.10f}\n\n")
+    
+    improvement = ((avg_mse_sp - avg_mse_mm) / avg_mse_sp) * 100
+    out.append(f"  → Min-Max shows {improvement:.1f}% improvement over Unit Sphere\n\n")
+    
+    out.append(_CONCLUSIONS)
+    out.append(_FOOTER)
+    
+    write_parts(report_file, out)
     
     print(f"✓ Created comprehensive report: {report_file}")
     return report_file
 
-def create_file_manifest(base_path):
+def enumerate_dir(path, suffixes=None):
+    try:
+        with os.scandir(path) as entries:
+            return sorted((entry.name, entry.stat().st_size) for entry in entries
+                          if entry.is_file() and (entry.name.endswith(suffixes) if suffixes else '.' in entry.name))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+def stat_files(paths):
+    files = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            files.append((os.path.basename(path), st.st_size))
+    return files
+
+def write_manifest(base_path, ts_pretty):
     manifest_file = base_path / 'FILE_MANIFEST.txt'
-    with open(manifest_file, 'w', encoding='utf-8') as f:
-        f.write("=" * 80 + "\n")
-        f.write("FILE MANIFEST - 3D Mesh Normalization Project\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 80 + "\n\n")
-        
-        directories = {
-            'Input Meshes (8samples/)': list((base_path / '8samples').glob('*.obj')) if (base_path / '8samples').exists() else [],
-            'Source Code (src/)': list((base_path / 'src').glob('*.py')) if (base_path / 'src').exists() else [],
-            'Output Files (outputs/)': list((base_path / 'outputs').glob('*.*')) if (base_path / 'outputs').exists() else [],
-            'Visualizations (outputs/visuals/)': list((base_path / 'outputs' / 'visuals').glob('*.png')) if (base_path / 'outputs' / 'visuals').exists() else [],
-            'Log Files (logs/)': list((base_path / 'logs').glob('*.log')) if (base_path / 'logs').exists() else [],
-            'Documentation': [base_path / 'README.md', base_path / 'outputs' / 'REPORT.txt']
-        }
-        
-        for dir_name, files in directories.items():
-            f.write(f"\n{dir_name}\n")
-            f.write("-" * 80 + "\n")
-            
-            valid_files = [f for f in files if f.exists() and f.is_file()]
-            
-            if not valid_files:
-                f.write("  (no files)\n")
-            else:
-                for file in sorted(valid_files):
-                    size = file.stat().st_size
-                    size_str = f"{size:,} bytes"
-                    f.write(f"  {file.name:<40} {size_str:>20}\n")
-        
-        f.write("\n" + "=" * 80 + "\n")
-        f.write(f"Total project files documented\n")
-        f.write("=" * 80 + "\n")
+    base = os.fspath(base_path)
+    samples_dir = os.path.join(base, '8samples')
+    src_dir = os.path.join(base, 'src')
+    outputs_dir = os.path.join(base, 'outputs')
+    visuals_dir = os.path.join(outputs_dir, 'visuals')
+    logs_dir = os.path.join(base, 'logs')
+    readme_file = os.path.join(base, 'README.md')
+        
+    out = [banner(_MANIFEST_TITLE, ts_pretty), _EQ80_NL + "\n"]
+    
+    directories = {
+        'Input Meshes (8samples/)': enumerate_dir(samples_dir, '.obj'),
+        'Source Code (src/)': enumerate_dir(src_dir, '.py'),
+        'Output Files (outputs/)': enumerate_dir(outputs_dir),
+        'Visualizations (outputs/visuals/)': enumerate_dir(visuals_dir, '.png'),
+        'Log Files (logs/)': enumerate_dir(logs_dir, '.log'),
+        'Documentation': stat_files([readme_file, os.path.join(outputs_dir, 'REPORT.txt')])
+    }
+    
+    for dir_name, files in directories.items():
+        out.append(f"\n{dir_name}\n")
+        out.append(_DASH80_NL)
+        
+        if not files:
+            out.append("  (no files)\n")
+        else:
+            for name, size in files:
+                size_str = f"{size:,} bytes"
+                out.append(f"  {name:<40} {size_str:>20}\n")
+    
+    out.append("\n" + _EQ80_NL)
+    out.append("Total project files documented\n")
+    out.append(_EQ80_NL)
+    write_parts(manifest_file, out)
     
     print(f"✓ Created file manifest: {manifest_file}")
     return manifest_file
 
-def update_log():
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_path = Path('logs') / f'step8_{timestamp}.log'
-    with open(log_path, 'w', encoding='utf-8') as f:
-        f.write(f"Step 8 - Packaging & Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 60 + "\n\n")
-        f.write("Completed:\n")
-        f.write("  * README.md updated with comprehensive documentation\n")
-        f.write("  * REPORT.txt generated with detailed analysis\n")
-        f.write("  * FILE_MANIFEST.txt created\n")
-        f.write("  * All files organized and ready for submission\n")
+def write_log(ts_pretty, ts_compact, report_reused=False):
+    log_path = Path('logs') / f'step8_{ts_compact}.log'
+    report_line = ("  * REPORT.txt reused (inputs unchanged, timestamp refreshed)\n"
+                   if report_reused else
+                   "  * REPORT.txt generated with detailed analysis\n")
+    text = (
+        f"Step 8 - Packaging & Report - {ts_pretty}\n"
+        + "=" * 60 + "\n\n"
+        "Completed:\n"
+        "  * README.md updated with comprehensive documentation\n"
+        + report_line +
+        "  * FILE_MANIFEST.txt created\n"
+        "  * All files organized and ready for submission\n"
+    )
+    write_parts(log_path, (text,))
     
     print(f"✓ Log file created: {log_path}")
 
@@ -302,11 +417,26 @@ def main():
     
     print("\nCreating final documentation...")
     
-    report_file = create_report_text(output_path)
+    now = datetime.now()
+    ts_pretty = now.strftime('%Y-%m-%d %H:%M:%S')
+    ts_compact = now.strftime('%Y%m%d_%H%M%S')
+    
+    report_file = output_path / 'REPORT.txt'
+    
+    stats_files, metrics_files = find_outputs(output_path)
+    mesh_names = sorted({item[0] for item in metrics_files})
+    
+    report_reused = (report_is_current(report_file, stats_files, metrics_files)
+                     and restamp_report(report_file, mesh_names, ts_pretty))
+    if report_reused:
+        print(f"✓ Report up to date, refreshed timestamp: {report_file}")
+    else:
+        data = scan_outputs(stats_files, metrics_files)
+        write_report(report_file, data, ts_pretty)
     
-    manifest_file = create_file_manifest(base_path)
+    manifest_file = write_manifest(base_path, ts_pretty)
     
-    update_log()
+    write_log(ts_pretty, ts_compact, report_reused)
     
     print("\n" + "=" * 60)
     print("✓ Step 8 completed successfully!")